@@ -0,0 +1,4 @@
+"""Shared helpers for the percentage gauge scripts.
+
+Submodules are imported on demand so that importing the package stays cheap.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from gauges.cli import main
+
+sys.exit(main())
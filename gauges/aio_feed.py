@@ -0,0 +1,188 @@
+"""asyncio socket ingest for the pygame dial.
+
+gauges.feed serves the Tk scripts from reader threads. This module does
+the same job on the asyncio loop that sliderV4-1 already runs, so no
+threads are needed and nothing blocks a frame. Listeners:
+
+    udp:PORT          datagrams on 127.0.0.1:PORT
+    tcp:PORT          stream connections on 127.0.0.1:PORT
+    unix:PATH         stream connections on a Unix-domain socket
+
+Each datagram or stream carries records in either of two formats, which
+can be mixed:
+
+    text     one "label,percentage" line or JSON object per line (see gauges.feed)
+    binary   a 0x00 byte, float32 percentage and uint16 label length
+             (little-endian), then the UTF-8 label; see encode_binary
+
+Values go into a LatestBuffer that keeps only the newest percentage per
+label, for at most MAX_LABELS labels. A flood overwrites stale values
+instead of queueing them. The consumer drains the buffer once per frame,
+so latency is bounded by one frame. A stream connection that sends more
+than READ_BUDGET bytes within one frame is paused until the next frame,
+which pushes backpressure to the sender through TCP flow control.
+
+Usage:
+    python sliderV4-1.py --listen udp:9000 --listen unix:/tmp/dial.sock
+"""
+import asyncio
+import math
+import os
+import struct
+import sys
+from collections import OrderedDict
+
+from gauges.feed import parse_record
+
+BINARY_MARKER = 0
+BINARY = struct.Struct("<BfH")  # marker, percentage, label length
+MAX_LABELS = 1024
+MAX_LINE = 4096                 # Longest text line kept while waiting for its newline
+READ_BUDGET = 256 * 1024        # Bytes per stream connection per frame before reading pauses
+TICK = 1.0 / 60
+
+
+def encode_binary(label, percentage):
+    """Encode one record in the compact binary format."""
+    data = label.encode("utf-8")
+    return BINARY.pack(BINARY_MARKER, percentage, len(data)) + data
+
+
+def parse_buffer(data):
+    """Parse complete records from bytes; returns (records, unconsumed tail).
+
+    Invalid records are skipped. An unterminated text line longer than
+    MAX_LINE is discarded, so a peer cannot grow the buffer without bound.
+    """
+    records = []
+    pos, size = 0, len(data)
+    while pos < size:
+        if data[pos] == BINARY_MARKER:
+            if size - pos < BINARY.size:
+                break
+            _, percentage, length = BINARY.unpack_from(data, pos)
+            end = pos + BINARY.size + length
+            if end > size:
+                break
+            label = data[pos + BINARY.size:end].decode("utf-8", "replace")
+            pos = end
+            if not math.isnan(percentage) and 0 <= percentage <= 100:
+                records.append(("\n".join(label.splitlines()[:3]), percentage))
+        else:
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                if size - pos > MAX_LINE:
+                    pos = size
+                break
+            record = parse_record(data[pos:newline].decode("utf-8", "replace"))
+            pos = newline + 1
+            if record is not None:
+                records.append(record)
+    return records, data[pos:]
+
+
+class LatestBuffer:
+    """Newest percentage per label, most recently updated label last."""
+
+    def __init__(self, maxlabels=MAX_LABELS, on_update=None):
+        self.maxlabels = maxlabels
+        self.on_update = on_update
+        self.received = 0
+        self.overwritten = 0  # Values replaced before the consumer saw them
+        self.evicted = 0      # Labels dropped because of the label limit
+        self._values = OrderedDict()
+
+    def put(self, label, percentage):
+        """Store a value, replacing any pending value for the label."""
+        self.received += 1
+        if label in self._values:
+            self.overwritten += 1
+            self._values.move_to_end(label)
+        self._values[label] = percentage
+        if len(self._values) > self.maxlabels:
+            self._values.popitem(last=False)
+            self.evicted += 1
+
+    def put_all(self, records):
+        """Store parsed records and notify the consumer once."""
+        for label, percentage in records:
+            self.put(label, percentage)
+        if records and self.on_update is not None:
+            self.on_update()
+
+    def drain(self):
+        """Return and clear the pending values as an OrderedDict, newest last."""
+        values, self._values = self._values, OrderedDict()
+        return values
+
+
+class _StreamProtocol(asyncio.Protocol):
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.transport = None
+        self._pending = b""
+        self._budget = READ_BUDGET
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        records, self._pending = parse_buffer(self._pending + data)
+        self.buffer.put_all(records)
+        self._budget -= len(data)
+        if self._budget <= 0:
+            self.transport.pause_reading()
+            asyncio.get_running_loop().call_later(TICK, self._resume)
+
+    def _resume(self):
+        self._budget = READ_BUDGET
+        if not self.transport.is_closing():
+            self.transport.resume_reading()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def datagram_received(self, data, addr):
+        # A datagram holds whole records; the last text line may omit its newline
+        records, rest = parse_buffer(data)
+        if rest and rest[0] != BINARY_MARKER:
+            records += parse_buffer(rest + b"\n")[0]
+        self.buffer.put_all(records)
+
+
+async def listen(source, buffer):
+    """Start one listener; returns an object with a close() method."""
+    loop = asyncio.get_running_loop()
+    if source.startswith("udp:"):
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(buffer), local_addr=("127.0.0.1", int(source[4:])))
+        return transport
+    if source.startswith("tcp:"):
+        return await loop.create_server(lambda: _StreamProtocol(buffer), "127.0.0.1", int(source[4:]))
+    if source.startswith("unix:"):
+        path = source[5:]
+        if os.path.exists(path):
+            os.unlink(path)
+        return await loop.create_unix_server(lambda: _StreamProtocol(buffer), path)
+    raise ValueError(f"Unknown listen source {source!r}")
+
+
+async def start_ingest(sources, on_update=None, maxlabels=MAX_LABELS):
+    """Listen on every source; returns (LatestBuffer, listeners)."""
+    buffer = LatestBuffer(maxlabels, on_update)
+    listeners = [await listen(source, buffer) for source in sources]
+    return buffer, listeners
+
+
+def sources_from_argv(argv=None):
+    """All SOURCE values given as --listen SOURCE on the command line."""
+    argv = sys.argv[1:] if argv is None else argv
+    sources = []
+    for i, arg in enumerate(argv):
+        if arg == "--listen":
+            if i + 1 >= len(argv):
+                raise SystemExit("--listen needs a source: udp:PORT, tcp:PORT or unix:PATH")
+            sources.append(argv[i + 1])
+    return sources
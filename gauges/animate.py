@@ -0,0 +1,427 @@
+"""Streaming animated GIF/APNG export of a percentage timeline.
+
+A timeline is a file of (timestamp, percentage) samples. It is replayed
+at a chosen speed and sampled at a fixed output frame rate. Each output
+frame shows the gauge for the newest sample at that time, quantized to
+--step. Memory stays bounded however long the timeline is:
+
+* the input is read one row at a time, and runs of frames with the same
+  quantized value are counted rather than listed;
+* a frame is rendered only when the quantized value changes, with a small
+  LRU of rendered frames for values that come back;
+* a frame is encoded and written as soon as the next different frame
+  arrives, and that is when its duration is known. Frames identical to
+  the previous one are merged into a longer duration. Only the changed
+  rectangle of each frame is stored.
+
+The writers hold just the previous frame. APNG is written with zlib and
+a frame count that is patched in when the file is closed. GIF uses a
+fixed 256-color palette and a pure-Python LZW encoder, so neither needs
+Pillow.
+
+Styles: donut (sliderV4-1), arc (slider4), pie (slider3) from
+gauges.raster, and bar (sliderV3-1) from gauges.batch_render.
+
+Usage:
+    python -m gauges.animate cpu.csv cpu.gif --style donut --duration 20
+    python -m gauges.animate cpu.jsonl cpu.png --style bar --speed 3600 --fps 10
+"""
+import argparse
+import csv
+import json
+import math
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+
+from gauges.batch_input import detect_format
+from gauges.raster import _png_chunk
+
+STYLES = ("donut", "arc", "pie", "bar")
+FORMATS = ("gif", "apng")
+CACHE_FRAMES = 128
+
+
+def _parse_time(value):
+    """Seconds since the epoch from a number or an ISO 8601 string."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def iter_timeline(path, fmt=None):
+    """Yield (timestamp, percentage) from a CSV or JSONL file, skipping invalid rows.
+
+    CSV rows are "timestamp,percentage"; JSONL objects have "timestamp"
+    and "percentage" keys. Timestamps are epoch seconds or ISO 8601.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, newline="" if fmt == "csv" else None) as f:
+        rows = csv.reader(f) if fmt == "csv" else (line for line in f if line.strip())
+        for row in rows:
+            try:
+                if fmt == "csv":
+                    timestamp, percentage = row[:2]
+                else:
+                    data = json.loads(row)
+                    timestamp, percentage = data["timestamp"], data["percentage"]
+                    if isinstance(percentage, bool):
+                        continue
+                timestamp, percentage = _parse_time(timestamp), float(percentage)
+            except (TypeError, ValueError, KeyError):
+                continue  # Header, short row, non-JSON line or non-object JSON
+            if 0 <= percentage <= 100:
+                yield timestamp, percentage
+
+
+def time_span(samples):
+    """(first, last) timestamp of a timeline, read in one streaming pass."""
+    first = last = None
+    for timestamp, _ in samples:
+        if first is None:
+            first = timestamp
+        last = timestamp
+    return first, last
+
+
+def resample(samples, interval):
+    """Yield (percentage, frames) runs: the value held for that many output frames.
+
+    Output frame k starts at first_timestamp + k * interval and shows the
+    newest sample at or before that time. Long gaps become one long run.
+    """
+    it = iter(samples)
+    try:
+        tick, value = next(it)
+    except StopIteration:
+        return
+    for timestamp, percentage in it:
+        if timestamp > tick:
+            frames = math.ceil((timestamp - tick) / interval)
+            yield value, frames
+            tick += frames * interval
+        value = percentage
+    yield value, 1
+
+
+def frame_runs(samples, interval, step):
+    """Merge resampled runs whose values quantize to the same key; yields (key, frames)."""
+    key, frames = None, 0
+    for value, count in resample(samples, interval):
+        k = int(value / step + 0.5)
+        if k == key:
+            frames += count
+            continue
+        if key is not None:
+            yield key, frames
+        key, frames = k, count
+    if key is not None:
+        yield key, frames
+
+
+class FrameRenderer:
+    """RGB frames for quantized keys, with a small LRU cache."""
+
+    def __init__(self, style, size, step, label="", cache_size=CACHE_FRAMES):
+        self.step = step
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        if style == "bar":
+            import matplotlib
+            matplotlib.use("Agg")
+            from gauges.batch_render import BarRenderer
+            self._bar = BarRenderer()
+            self._bar.fig.set_dpi(size / 8)  # The bar figure is 8 inches wide
+            self._label = label
+            self._render = self._render_bar
+        else:
+            from gauges.raster import get_raster
+            raster = get_raster(style, size)
+            self._render = lambda percentage: raster.render(percentage)[..., :3]
+
+    def _render_bar(self, percentage):
+        self._bar.update(self._label, percentage)
+        self._bar.fig.canvas.draw()
+        return np.asarray(self._bar.fig.canvas.buffer_rgba())[..., :3].copy()
+
+    def frame(self, key):
+        """Frame for a quantized key; the array is shared, do not modify it."""
+        frame = self._cache.get(key)
+        if frame is not None:
+            self._cache.move_to_end(key)
+            return frame
+        frame = self._render(min(100.0, key * self.step))
+        self._cache[key] = frame
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return frame
+
+
+def _changed_box(previous, frame):
+    """Bounding box (x0, y0, x1, y1) of pixels that differ, or None if none do."""
+    diff = np.any(previous != frame, axis=2)
+    rows = np.flatnonzero(diff.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+class _AnimationWriter:
+    """Common part of the writers: holds one pending frame and merges repeats.
+
+    Subclasses implement _write_frame(frame, box, duration), where box is
+    the changed rectangle relative to the previous frame written.
+    """
+
+    MAX_DELAY = 600.0  # Seconds; longer durations are written as extra hold frames
+
+    def __init__(self, f, width, height):
+        self.f = f
+        self.width, self.height = width, height
+        self.frames = 0
+        self._previous = None  # Last frame written
+        self._pending = None
+        self._pending_duration = 0.0
+
+    def add(self, frame, duration):
+        """Queue a frame shown for duration seconds."""
+        if self._pending is not None and (self._pending is frame or np.array_equal(self._pending, frame)):
+            self._pending_duration += duration
+            return
+        self._flush()
+        self._pending, self._pending_duration = frame, duration
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        frame, remaining = self._pending, self._pending_duration
+        if self._previous is None:
+            box = (0, 0, self.width, self.height)
+        else:
+            box = _changed_box(self._previous, frame) or (0, 0, 1, 1)
+        while True:
+            duration = min(remaining, self.MAX_DELAY)
+            self._write_frame(frame, box, duration)
+            self.frames += 1
+            remaining -= duration
+            if remaining <= 1e-9:
+                break
+            box = (0, 0, 1, 1)  # Hold: rewrite one unchanged pixel for the rest
+        self._previous, self._pending = frame, None
+
+    def close(self):
+        """Write the last frame and finish the file."""
+        self._flush()
+        self._finish()
+
+
+class ApngWriter(_AnimationWriter):
+    """Animated PNG writer; the output file must be seekable for the frame count."""
+
+    def __init__(self, f, width, height, loops=0, compression=6):
+        super().__init__(f, width, height)
+        self.loops = loops
+        self.compression = compression
+        self._sequence = 0
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        self._actl_offset = f.tell()
+        f.write(_png_chunk(b"acTL", struct.pack(">II", 0, loops)))
+
+    def _compress(self, pixels):
+        # Every scanline uses the Up filter, which suits the flat gauge images
+        height, width = pixels.shape[:2]
+        rows = pixels.reshape(height, width * 3)
+        filtered = np.empty((height, width * 3 + 1), dtype=np.uint8)
+        filtered[:, 0] = 2
+        filtered[0, 1:] = rows[0]
+        filtered[1:, 1:] = rows[1:] - rows[:-1]  # uint8 arithmetic wraps modulo 256
+        return zlib.compress(filtered.tobytes(), self.compression)
+
+    def _write_frame(self, frame, box, duration):
+        x0, y0, x1, y1 = box
+        milliseconds = int(round(duration * 1000))
+        numerator, denominator = (milliseconds, 1000) if milliseconds < 65536 else (int(round(duration * 100)), 100)
+        fctl = struct.pack(">IIIIIHHBB", self._sequence, x1 - x0, y1 - y0, x0, y0,
+                           numerator, denominator, 0, 0)
+        self.f.write(_png_chunk(b"fcTL", fctl))
+        self._sequence += 1
+        data = self._compress(np.ascontiguousarray(frame[y0:y1, x0:x1]))
+        if self.frames == 0:
+            self.f.write(_png_chunk(b"IDAT", data))
+        else:
+            self.f.write(_png_chunk(b"fdAT", struct.pack(">I", self._sequence) + data))
+            self._sequence += 1
+
+    def _finish(self):
+        self.f.write(_png_chunk(b"IEND", b""))
+        end = self.f.tell()
+        self.f.seek(self._actl_offset)
+        self.f.write(_png_chunk(b"acTL", struct.pack(">II", self.frames, self.loops)))
+        self.f.seek(end)
+
+
+def _gif_palette():
+    """6x6x6 color cube followed by a 40-step grey ramp, as 768 bytes."""
+    levels = np.arange(6) * 51
+    cube = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    greys = np.repeat(np.round(np.arange(40) * 255 / 39), 3).reshape(-1, 3)
+    return np.concatenate([cube, greys]).astype(np.uint8).tobytes()
+
+
+GIF_PALETTE = _gif_palette()
+
+
+def to_gif_indices(pixels):
+    """Map RGB pixels to GIF_PALETTE indices; greys use the finer grey ramp."""
+    p = pixels.astype(np.uint16)
+    r, g, b = p[..., 0], p[..., 1], p[..., 2]
+    cube = (r * 5 + 127) // 255 * 36 + (g * 5 + 127) // 255 * 6 + (b * 5 + 127) // 255
+    grey = 216 + (r * 39 + 127) // 255
+    return np.where((r == g) & (g == b), grey, cube).astype(np.uint8)
+
+
+def lzw_encode(indices, min_code_size=8):
+    """GIF-flavoured LZW of a bytes-like of palette indices; returns the packed bytes."""
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    out = bytearray()
+    bits = count = 0
+    code_size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+
+    # Codes are packed least significant bit first
+    bits |= clear << count
+    count += code_size
+    data = bytes(indices)
+    prefix = data[0]
+    for byte in data[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << count
+        count += code_size
+        while count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            # Table full: start over so the codes keep adapting to the data
+            bits |= clear << count
+            count += code_size
+            table.clear()
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = byte
+    bits |= prefix << count
+    count += code_size
+    bits |= end << count
+    count += code_size
+    while count > 0:
+        out.append(bits & 0xFF)
+        bits >>= 8
+        count -= 8
+    return bytes(out)
+
+
+class GifWriter(_AnimationWriter):
+    """Animated GIF writer with a fixed palette; fully streaming."""
+
+    MAX_DELAY = 655.35  # Largest delay a graphic control extension can hold
+
+    def __init__(self, f, width, height, loops=0):
+        super().__init__(f, width, height)
+        self._elapsed = 0.0     # Seconds of animation so far
+        self._written_cs = 0    # Centiseconds of delay written so far
+        f.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0) + GIF_PALETTE)
+        # NETSCAPE2.0 application extension: loop count (0 = forever)
+        f.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loops) + b"\x00")
+
+    def _write_frame(self, frame, box, duration):
+        x0, y0, x1, y1 = box
+        # Round the running total, not each delay, so timing does not drift
+        self._elapsed += duration
+        delay = int(round(self._elapsed * 100)) - self._written_cs
+        self._written_cs += delay
+        self.f.write(b"\x21\xF9\x04\x04" + struct.pack("<H", delay) + b"\x00\x00")
+        self.f.write(b"\x2C" + struct.pack("<HHHHB", x0, y0, x1 - x0, y1 - y0, 0))
+        data = lzw_encode(to_gif_indices(frame[y0:y1, x0:x1]).tobytes())
+        blocks = bytearray(b"\x08")
+        for i in range(0, len(data), 255):
+            block = data[i:i + 255]
+            blocks.append(len(block))
+            blocks += block
+        blocks.append(0)
+        self.f.write(blocks)
+
+    def _finish(self):
+        self.f.write(b"\x3B")
+
+
+WRITERS = {"gif": GifWriter, "apng": ApngWriter}
+
+
+def export(samples, f, style="donut", fmt="gif", size=128, fps=10, speed=60.0,
+           step=0.1, label=""):
+    """Encode a timeline to an open binary file; returns (frames written, seconds).
+
+    speed is timeline seconds per output second, fps the output sampling
+    rate and step the quantization of the percentage.
+    """
+    renderer = FrameRenderer(style, size, step, label)
+    first = renderer.frame(0)
+    writer = WRITERS[fmt](f, first.shape[1], first.shape[0])
+    seconds = 0.0
+    for key, frames in frame_runs(samples, speed / fps, step):
+        writer.add(renderer.frame(key), frames / fps)
+        seconds += frames / fps
+    writer.close()
+    return writer.frames, seconds
+
+
+def main(argv=None):
+    """Command-line entry point for timeline export."""
+    parser = argparse.ArgumentParser(description="Export a percentage timeline as an animated GIF or APNG.")
+    parser.add_argument("input", help="CSV (timestamp,percentage) or JSONL timeline")
+    parser.add_argument("output", help="Output .gif or .png file")
+    parser.add_argument("--style", choices=STYLES, default="donut")
+    parser.add_argument("--format", choices=FORMATS, help="Default: from the output extension")
+    parser.add_argument("--size", type=int, default=128, help="Frame width in pixels")
+    parser.add_argument("--fps", type=float, default=10, help="Output frames per second (at most 50 for GIF)")
+    pace = parser.add_mutually_exclusive_group()
+    pace.add_argument("--speed", type=float, help="Timeline seconds per output second")
+    pace.add_argument("--duration", type=float, default=20.0, help="Length of the animation in seconds")
+    parser.add_argument("--step", type=float, default=0.1, help="Percentage quantization")
+    parser.add_argument("--label", default="", help="Title for the bar style")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("gif" if args.output.lower().endswith(".gif") else "apng")
+    if fmt == "gif" and args.fps > 50:
+        parser.error("GIF delays are in centiseconds; use --fps 50 or less")
+    speed = args.speed
+    if speed is None:
+        # One extra streaming pass over the timestamps to fit the requested duration
+        first, last = time_span(iter_timeline(args.input))
+        if first is None:
+            parser.error(f"{args.input} has no valid samples")
+        speed = max(last - first, 1e-9) / args.duration
+    with open(args.output, "wb") as f:
+        frames, seconds = export(iter_timeline(args.input), f, args.style, fmt, args.size,
+                                 args.fps, speed, args.step, args.label)
+    print(f"Wrote {frames} frames ({seconds:.1f} s at {speed:g}x) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
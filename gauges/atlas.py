@@ -0,0 +1,253 @@
+"""Pre-rendered gauge sprite atlases in memory-mapped files.
+
+A gauge is a pure function of its percentage, so with the percentage
+quantized to 0.1 every style has exactly FRAMES states. build_atlas
+renders all of them with gauges.raster into one raw RGBA file; Atlas maps
+that file read-only, so any number of processes share the same pages and
+showing a value is just slicing out a frame.
+
+File layout: a HEADER_SIZE-byte header (magic, version, frame count,
+width, height, channels, style) followed by the frames as contiguous
+height x width x 4 uint8 arrays.
+
+Display backends:
+    AtlasSurfaces   pygame Surfaces that wrap the mapped frames without copying
+    AtlasGauge      a single Tk canvas image item whose image is swapped per value
+    BackgroundAtlasGauge
+                    AtlasGauge once the atlas is open, a live gauge until then;
+                    a missing atlas is built in a thread, not in a Tk callback
+
+Usage:
+    python -m gauges.atlas build --style arc --radius 100
+    python slider4.py --atlas
+"""
+import argparse
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from gauges.raster import STYLES, WHITE, GaugeRaster, to_ppm_bytes
+
+FRAMES = 1001  # 0.0% to 100.0% in steps of 0.1
+MAGIC = b"GAUGEATL"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIII16s")
+HEADER_SIZE = 64
+MARGIN = 1.5  # Pixels around the gauge, as in GaugeRaster
+OUTER = {"donut": 1.0, "pie": 1.0, "arc": 1.05}
+
+
+def frame_index(percentage):
+    """Atlas frame for a percentage, quantized to 0.1 and clamped to 0-100."""
+    return min(FRAMES - 1, max(0, int(percentage * 10 + 0.5)))
+
+
+def size_for_radius(style, radius):
+    """Image size at which a style's unit radius is radius pixels, as drawn by the scripts."""
+    return int(round(2 * OUTER[style] * radius + 2 * MARGIN))
+
+
+def default_path(style, size):
+    """Location of a shared atlas in the per-user cache directory."""
+    cache = os.environ.get("GAUGES_CACHE_DIR",
+                           os.path.join(os.path.expanduser("~"), ".cache", "gauges"))
+    return os.path.join(cache, "atlas", f"{style}-{size}.rgba")
+
+
+def build_atlas(path, style, size, background=WHITE):
+    """Render every frame of a style into a new atlas file at path.
+
+    The file is written under a temporary name and renamed into place, so
+    readers never map a half-written atlas.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    raster = GaugeRaster(style, size, background, margin=MARGIN)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        header = HEADER.pack(MAGIC, VERSION, FRAMES, size, size, 4, style.encode())
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+    frames = np.memmap(tmp, dtype=np.uint8, mode="r+", offset=HEADER_SIZE,
+                       shape=(FRAMES, size, size, 4))
+    for i in range(FRAMES):
+        frames[i] = raster.render(i / 10)
+    frames.flush()
+    del frames
+    os.replace(tmp, path)
+    return path
+
+
+class Atlas:
+    """Read-only memory-mapped view of an atlas file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, count, width, height, channels, style = HEADER.unpack(
+                f.read(HEADER_SIZE)[:HEADER.size])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} gauge atlas")
+        self.path = path
+        self.style = style.rstrip(b"\0").decode()
+        self.width, self.height = width, height
+        self.frames = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+                                shape=(count, height, width, channels))
+
+    def frame(self, percentage):
+        """The (height, width, 4) RGBA frame for a percentage; a view, not a copy."""
+        return self.frames[frame_index(percentage)]
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def open_atlas(style, size, path=None):
+    """Open the atlas for style and size, building it first if it does not exist."""
+    path = path or default_path(style, size)
+    if not os.path.exists(path):
+        build_atlas(path, style, size)
+    return Atlas(path)
+
+
+class AtlasSurfaces:
+    """pygame Surfaces for atlas frames, sharing memory with the mapped file."""
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self._surfaces = {}
+
+    def surface(self, percentage):
+        """Surface for a percentage; blit it instead of drawing the gauge."""
+        import pygame
+        i = frame_index(percentage)
+        surface = self._surfaces.get(i)
+        if surface is None:
+            size = (self.atlas.width, self.atlas.height)
+            surface = pygame.image.frombuffer(self.atlas.frames[i], size, "RGBA")
+            self._surfaces[i] = surface
+        return surface
+
+
+class AtlasGauge:
+    """Tk canvas gauge drawn by swapping one image item between atlas frames.
+
+    Has the same set() interface as the tk_gauges classes. Converted frames
+    are kept in a bounded LRU of PhotoImages.
+    """
+
+    def __init__(self, canvas, atlas, center_x=150, center_y=150, cache_size=128):
+        self.canvas = canvas
+        self.atlas = atlas
+        self.cache_size = cache_size
+        self.percentage = None
+        self._photos = OrderedDict()
+        self.item = canvas.create_image(center_x, center_y, anchor="center")
+        self.items = (self.item,)
+
+    def _photo(self, index):
+        import tkinter as tk
+        photo = self._photos.get(index)
+        if photo is not None:
+            self._photos.move_to_end(index)
+            return photo
+        # The atlas background is opaque, so dropping alpha loses nothing
+        ppm = to_ppm_bytes(self.atlas.frames[index])
+        photo = tk.PhotoImage(master=self.canvas, data=ppm, format="ppm")
+        self._photos[index] = photo
+        if len(self._photos) > self.cache_size:
+            self._photos.popitem(last=False)
+        return photo
+
+    def set(self, percentage):
+        """Show the frame for percentage; no-op if it is unchanged."""
+        if percentage == self.percentage:
+            return
+        self.percentage = percentage
+        self.canvas.itemconfig(self.item, image=self._photo(frame_index(percentage)))
+
+    def move_to(self, center_x, center_y):
+        """Move the image so it is centered on (center_x, center_y)."""
+        self.canvas.coords(self.item, center_x, center_y)
+
+    def destroy(self):
+        """Delete the canvas item and drop cached images."""
+        self.canvas.delete(self.item)
+        self._photos.clear()
+
+
+class BackgroundAtlasGauge:
+    """Tk gauge whose atlas is opened, and built if missing, in a background thread.
+
+    Building an atlas renders all FRAMES frames and takes seconds, which
+    would freeze the window if done in a Tk callback. Until the atlas is
+    open, set() goes to a live gauge from make_fallback() (created on first
+    use); then an AtlasGauge replaces it, showing the latest value.
+    """
+
+    def __init__(self, canvas, style, size, make_fallback, center_x=150, center_y=150, interval_ms=100):
+        self.canvas = canvas
+        self.make_fallback = make_fallback
+        self.center = (center_x, center_y)
+        self.interval_ms = interval_ms
+        self.percentage = None
+        self.gauge = None
+        self._atlas = None
+        self._error = None
+        path = default_path(style, size)
+        if not os.path.exists(path):
+            print(f"Building {style} atlas at {path} in the background; drawing live until it is ready",
+                  file=sys.stderr)
+        self._thread = threading.Thread(target=self._open, args=(style, size, path), daemon=True)
+        self._thread.start()
+        canvas.after(interval_ms, self._poll)
+
+    def _open(self, style, size, path):
+        # Runs in the worker thread: NumPy and file I/O only, no Tk calls
+        try:
+            self._atlas = open_atlas(style, size, path)
+        except (OSError, ValueError) as e:
+            self._error = e
+
+    def _poll(self):
+        if self._thread.is_alive():
+            self.canvas.after(self.interval_ms, self._poll)
+            return
+        if self._atlas is None:
+            print(f"Atlas unavailable ({self._error}); keeping live drawing", file=sys.stderr)
+            return
+        if self.gauge is not None:
+            self.gauge.destroy()
+        self.gauge = AtlasGauge(self.canvas, self._atlas, *self.center)
+        if self.percentage is not None:
+            self.gauge.set(self.percentage)
+
+    def set(self, percentage):
+        """Show percentage on whichever gauge is current."""
+        self.percentage = percentage
+        if self.gauge is None:
+            self.gauge = self.make_fallback()
+        self.gauge.set(percentage)
+
+
+def main(argv=None):
+    """Build atlas files from the command line."""
+    parser = argparse.ArgumentParser(description="Pre-render gauge sprite atlases.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Render all frames of a style")
+    build.add_argument("--style", choices=STYLES, required=True)
+    size = build.add_mutually_exclusive_group(required=True)
+    size.add_argument("--size", type=int, help="Frame size in pixels")
+    size.add_argument("--radius", type=int, help="Gauge radius in pixels, as in the scripts")
+    build.add_argument("--out", help="Output path (default: the shared cache location)")
+    args = parser.parse_args(argv)
+
+    frame_size = args.size or size_for_radius(args.style, args.radius)
+    path = build_atlas(args.out or default_path(args.style, frame_size), args.style, frame_size)
+    megabytes = os.path.getsize(path) / 2 ** 20
+    print(f"Wrote {FRAMES} frames of {frame_size}x{frame_size} to {path} ({megabytes:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
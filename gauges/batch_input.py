@@ -0,0 +1,187 @@
+"""Streaming CSV/JSONL input for batch rendering.
+
+Replaces the interactive get_valid_label/get_valid_percentage prompts of
+sliderV3-1/sliderV3-2 for bulk runs. Files are read in fixed-size chunks.
+Each chunk is validated with NumPy: the percentage must parse and lie in
+0-100, and the label may have at most three lines and MAX_LABEL_LENGTH
+characters. Bad rows go to a reject file with their line number and
+reason instead of prompting again. Memory use depends on the chunk size,
+not the file size.
+
+CSV rows are "label,percentage" (an optional header row is skipped).
+JSONL rows are objects with "label" and "percentage" keys. In both, a
+literal "\\n" in the label separates lines and an empty label becomes
+"Default Label", as in the interactive prompt.
+"""
+import csv
+import json
+import os
+
+import numpy as np
+
+CHUNK_SIZE = 50_000
+MAX_LABEL_LINES = 3
+MAX_LABEL_LENGTH = 120  # Characters, three lines of about 40; bounds the chunk's label array width
+DEFAULT_LABEL = "Default Label"
+
+REJECT_FIELDS = ("line", "reason", "label", "percentage")
+
+
+def detect_format(path):
+    """Guess "csv" or "jsonl" from the file extension."""
+    ext = os.path.splitext(path)[1].lower()
+    return "jsonl" if ext in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def _raw_csv_rows(f):
+    """Yield (line_number, label, raw_percentage, reason) from a CSV stream."""
+    reader = csv.reader(f)
+    for row in reader:
+        line = reader.line_num
+        if line == 1 and len(row) >= 2 and row[1].strip().lower() in ("percentage", "pct", "value"):
+            continue  # Header
+        if len(row) < 2:
+            yield line, row[0] if row else "", None, None
+        else:
+            yield line, row[0], row[1], None
+
+
+def _raw_jsonl_rows(f):
+    """Yield (line_number, label, raw_percentage, reason) from a JSONL stream.
+
+    reason is None unless the row is already known to be bad: not a JSON
+    object, a non-text label such as null, or a boolean percentage.
+    """
+    for line, text in enumerate(f, 1):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            yield line, text.strip(), None, "malformed_row"
+            continue
+        label, percentage = data.get("label", ""), data.get("percentage")
+        if label is None or isinstance(label, (bool, list, dict)):
+            yield line, str(label), percentage, "bad_label"
+        elif isinstance(percentage, bool):
+            yield line, str(label), percentage, "bad_number"
+        else:
+            yield line, str(label), percentage, None
+
+
+def _chunks(rows, chunk_size):
+    """Group raw rows into lists of at most chunk_size."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _parse_percentages(raw):
+    """Convert raw values to float64, with NaN where a value does not parse."""
+    try:
+        return np.array([v if v is not None else "nan" for v in raw], dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(raw), dtype=np.float64)
+        for i, v in enumerate(raw):
+            try:
+                out[i] = float(v)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def validate_chunk(labels, raw_percentages, row_reasons=None):
+    """Validate one chunk; returns (labels, percentages, reasons).
+
+    labels is a NumPy string array with "\\n" unescaped and defaults filled
+    in, percentages is float64, and reasons is an object array holding None
+    for valid rows or a short reject reason. row_reasons, if given, holds
+    reasons already found while reading and takes precedence.
+    """
+    # A NumPy string array is as wide as its longest element, so labels are
+    # stored at most one character past the limit (NumPy truncates on
+    # assignment) and anything that reached that width is rejected
+    labels = np.asarray(labels, dtype=f"<U{MAX_LABEL_LENGTH + 1}")
+    too_long = np.char.str_len(labels) > MAX_LABEL_LENGTH
+    labels = np.where(too_long, "", labels)
+    labels = np.char.replace(labels, "\\n", "\n")
+    labels = np.char.strip(labels)
+    labels = np.where(labels == "", DEFAULT_LABEL, labels)
+    percentages = _parse_percentages(raw_percentages)
+
+    reasons = np.full(len(labels), None, dtype=object)
+    raw = np.fromiter(raw_percentages, dtype=object, count=len(raw_percentages))
+    missing = (raw == None) | (raw == "")  # noqa: E711 - elementwise on an object array
+    bad_number = np.isnan(percentages) & ~missing
+    out_of_range = ~np.isnan(percentages) & ((percentages < 0) | (percentages > 100))
+    too_many_lines = np.char.count(labels, "\n") >= MAX_LABEL_LINES
+    reasons[too_many_lines] = "too_many_lines"
+    reasons[out_of_range] = "out_of_range"
+    reasons[bad_number] = "bad_number"
+    reasons[missing] = "missing_percentage"
+    reasons[too_long] = "label_too_long"
+    if row_reasons is not None:
+        row_reasons = np.fromiter(row_reasons, dtype=object, count=len(row_reasons))
+        known = row_reasons != None  # noqa: E711
+        reasons[known] = row_reasons[known]
+    return labels, percentages, reasons
+
+
+class RejectWriter:
+    """CSV sink for rejected rows; a no-op when path is None."""
+
+    def __init__(self, path):
+        self.count = 0
+        self._file = open(path, "w", newline="") if path else None
+        self._writer = csv.writer(self._file) if self._file else None
+        if self._writer:
+            self._writer.writerow(REJECT_FIELDS)
+
+    def write(self, line, reason, label, percentage):
+        self.count += 1
+        if self._writer:
+            self._writer.writerow((line, reason, label, percentage))
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_chunks(path, reject_path=None, chunk_size=CHUNK_SIZE, fmt=None):
+    """Yield validated (labels, percentages) NumPy arrays chunk by chunk.
+
+    Rejected rows are written to reject_path (if given) as they are found.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, newline="" if fmt == "csv" else None) as f, RejectWriter(reject_path) as rejects:
+        rows = _raw_csv_rows(f) if fmt == "csv" else _raw_jsonl_rows(f)
+        for chunk in _chunks(rows, chunk_size):
+            lines, raw_labels, raw_values, row_reasons = zip(*chunk)
+            labels, percentages, reasons = validate_chunk(raw_labels, raw_values, row_reasons)
+            bad = np.flatnonzero(reasons != None)  # noqa: E711 - elementwise on an object array
+            for i in bad:
+                rejects.write(lines[i], reasons[i], raw_labels[i], raw_values[i])
+            if len(bad):
+                keep = reasons == None  # noqa: E711
+                labels, percentages = labels[keep], percentages[keep]
+            if len(labels):
+                yield labels, percentages
+
+
+def iter_records(path, reject_path=None, chunk_size=CHUNK_SIZE, fmt=None):
+    """Yield valid (label, percentage) pairs, streaming in chunks."""
+    for labels, percentages in iter_chunks(path, reject_path, chunk_size, fmt):
+        yield from zip(labels.tolist(), percentages.tolist())
@@ -0,0 +1,184 @@
+"""Headless batch renderer for the sliderV3 bar and dial visualizations.
+
+Each worker process builds one figure on the Agg backend and then only
+updates the bar/arc, the percentage text and the title for every record,
+so thousands of PNGs can be written without rebuilding the figure.
+
+Usage:
+    python -m gauges.batch_render metrics.csv out_dir --style dial --workers 8
+    python -m gauges.batch_render metrics.jsonl out_dir --rejects rejects.csv
+"""
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from gauges.batch_input import iter_records
+from gauges.colors import get_color
+
+STYLES = ("bar", "dial")
+
+_renderer = None  # Per-process renderer, created by _init_worker
+
+
+class BarRenderer:
+    """Reusable figure matching visualize_percentage in sliderV3-1.py."""
+
+    def __init__(self, dpi=100):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        sns.set_style("whitegrid")
+        self.dpi = dpi
+        self.fig, ax = plt.subplots(figsize=(8, 4))
+        self.ax = ax
+
+        # Bar, text and title are created once and updated in place
+        self.bar = ax.barh(0, 0, height=0.8, color="red")[0]
+        self.text = ax.text(0, 0, "", va="center", color="white", fontsize=12, fontweight="bold")
+        self.title = ax.set_title("\n\n", pad=20, fontsize=12, wrap=True)
+
+        ax.set_xlim(0, 100)
+        ax.set_ylim(-0.5, 0.5)
+        ax.set_xlabel("Percentage (%)")
+        ax.set_yticks([])
+        sns.despine(ax=ax, left=True, bottom=False)
+
+        # Lay out once with a three-line placeholder title so every label fits
+        self.fig.tight_layout()
+
+    def update(self, label, percentage):
+        """Point the existing artists at a new label and percentage."""
+        color = get_color(percentage)
+        self.bar.set_width(percentage)
+        self.bar.set_color(color)
+        self.text.set_x(percentage)
+        self.text.set_text(f"{percentage:.1f}%")
+        self.text.set_horizontalalignment("right" if percentage > 90 else "left")
+        self.title.set_text(label)
+
+    def render(self, label, percentage, path):
+        """Update the figure and write it to path as a PNG."""
+        self.update(label, percentage)
+        self.fig.savefig(path, dpi=self.dpi)
+
+
+class DialRenderer(BarRenderer):
+    """Reusable figure matching visualize_percentage_dial in sliderV3-2.py."""
+
+    def __init__(self, dpi=100):
+        import matplotlib.pyplot as plt
+        import numpy as np
+        import seaborn as sns
+
+        sns.set_style("whitegrid")
+        self.dpi = dpi
+        self.fig, ax = plt.subplots(figsize=(8, 6), subplot_kw={"projection": "polar"})
+        self.ax = ax
+
+        # Gauge arc first, grey background arc drawn over it as in sliderV3-2
+        self.bar = ax.barh(0, 0, color="red", height=0.4, alpha=0.8)[0]
+        ax.barh(0, np.pi, color="lightgrey", height=0.4, alpha=0.3)
+
+        ax.set_ylim(-0.5, 0.5)
+        ax.set_yticks([])
+        ax.set_xticks([0, np.pi / 4, np.pi / 2, 3 * np.pi / 4, np.pi])
+        ax.set_xticklabels(["0%", "25%", "50%", "75%", "100%"], fontsize=10)
+        self.text = ax.text(0, 0, "", ha="center", va="center", fontsize=20, fontweight="bold")
+        self.title = ax.set_title("\n\n", pad=20, fontsize=12, wrap=True)
+        ax.set_frame_on(False)
+
+        self.fig.tight_layout()
+
+    def update(self, label, percentage):
+        """Point the existing artists at a new label and percentage."""
+        import numpy as np
+        self.bar.set_width((percentage / 100) * np.pi)
+        self.bar.set_color(get_color(percentage))
+        self.text.set_text(f"{percentage:.1f}%")
+        self.title.set_text(label)
+
+
+RENDERERS = {"bar": BarRenderer, "dial": DialRenderer}
+
+
+def output_name(index, label):
+    """Build a stable, filesystem-safe PNG name for a record."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")[:40] or "gauge"
+    return f"{index:06d}_{slug}.png"
+
+
+def _init_worker(style, dpi):
+    """Create the per-process figure once, on the Agg backend."""
+    global _renderer
+    import matplotlib
+    matplotlib.use("Agg")
+    _renderer = RENDERERS[style](dpi=dpi)
+
+
+def _render_chunk(out_dir, start, chunk):
+    """Render one chunk of (label, percentage) records in a worker."""
+    for offset, (label, percentage) in enumerate(chunk):
+        path = os.path.join(out_dir, output_name(start + offset, label))
+        _renderer.render(label, percentage, path)
+    return len(chunk)
+
+
+def _chunks(records, chunk_size):
+    """Yield (start_index, list_of_records) without materializing the input."""
+    it = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def render_batch(records, out_dir, style="bar", workers=None, chunk_size=200, dpi=100):
+    """Render an iterable of (label, percentage) pairs to PNGs in out_dir.
+
+    Chunks are spread over a process pool; at most two chunks per worker are
+    in flight so arbitrarily long inputs are not read into memory up front.
+    Returns the number of images written.
+    """
+    if style not in RENDERERS:
+        raise ValueError(f"Unknown style {style!r}, expected one of {STYLES}")
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    written = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(style, dpi)) as pool:
+        pending = []
+        for start, chunk in _chunks(records, chunk_size):
+            pending.append(pool.submit(_render_chunk, out_dir, start, chunk))
+            if len(pending) >= 2 * workers:
+                written += pending.pop(0).result()
+        for future in pending:
+            written += future.result()
+    return written
+
+
+def main(argv=None):
+    """Command-line entry point for batch rendering."""
+    parser = argparse.ArgumentParser(description="Render percentage gauges to PNG files in bulk.")
+    parser.add_argument("input", help="CSV (label,percentage) or JSONL file of records")
+    parser.add_argument("out_dir", help="Directory for the PNG files")
+    parser.add_argument("--style", choices=STYLES, default="bar")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--rejects", help="CSV file for rows that fail validation")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Input format (default: from extension)")
+    args = parser.parse_args(argv)
+
+    records = iter_records(args.input, args.rejects, fmt=args.format)
+    count = render_batch(records, args.out_dir, style=args.style,
+                         workers=args.workers, chunk_size=args.chunk_size, dpi=args.dpi)
+    print(f"Wrote {count} images to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
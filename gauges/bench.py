@@ -0,0 +1,413 @@
+"""Benchmark suite for color mapping and every drawing path.
+
+Times the color functions, the retained Tk canvas gauges, matplotlib
+figure creation and saving for the V2/V3 visualizations on Agg, and
+pygame dial/text frames on SDL's dummy video driver. Results are written
+as JSON so runs can be compared; --compare flags regressions against a
+previous result file.
+
+Usage:
+    python -m gauges.bench --json bench.json
+    python -m gauges.bench --filter color --compare bench.json
+"""
+import argparse
+import ast
+import io
+import json
+import os
+import platform
+import runpy
+import statistics
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_benchmarks = []
+
+
+class Skip(Exception):
+    """Raised by a benchmark setup when its toolkit is unavailable."""
+
+
+def benchmark(group, name):
+    """Register a setup function that returns the callable to time."""
+    def register(setup):
+        _benchmarks.append((group, name, setup))
+        return setup
+    return register
+
+
+def load_script(filename, run_name="bench"):
+    """Execute a script without its __main__ block and return its globals."""
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    return runpy.run_path(os.path.join(REPO_DIR, filename), run_name=run_name)
+
+
+def load_functions(filename, *names):
+    """Load selected functions from a script that builds a GUI at import time.
+
+    Only the top-level imports and the named function definitions are
+    executed, so the Tk window at the bottom of the script is never created.
+    """
+    path = os.path.join(REPO_DIR, filename)
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    body = [node for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+            or (isinstance(node, ast.FunctionDef) and node.name in names)]
+    namespace = {"__name__": "bench", "__file__": path}
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
+    return [namespace[name] for name in names]
+
+
+def time_call(func, min_time=0.2, repeat=5):
+    """Time func with an auto-ranged loop count; returns per-call seconds for each repeat."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / repeat / elapsed) + 1)
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return number, samples
+
+
+def _percentages(n=101):
+    return [100 * i / (n - 1) for i in range(n)]
+
+
+# Color mapping
+
+@benchmark("color", "colors.get_color (hex) x101")
+def _bench_get_color():
+    from gauges.colors import get_color
+    values = _percentages()
+    return lambda: [get_color(p) for p in values]
+
+
+@benchmark("color", "colors.get_color_rgb (sliderV4-1 interpolate_color) x101")
+def _bench_get_color_rgb():
+    from gauges.colors import get_color_rgb
+    values = _percentages()
+    return lambda: [get_color_rgb(p) for p in values]
+
+
+@benchmark("color", "colors.get_color_float (sliderV2) x101")
+def _bench_get_color_float():
+    from gauges.colors import get_color_float
+    values = _percentages()
+    return lambda: [get_color_float(p) for p in values]
+
+
+@benchmark("color", "colors.interpolate_color (two-stop) x101")
+def _bench_interpolate_color():
+    from gauges.colors import ORANGE, RED, interpolate_color
+    values = _percentages()
+    return lambda: [interpolate_color(p, 0, 100, RED, ORANGE) for p in values]
+
+
+@benchmark("color", "colors.get_colors hex x100k")
+def _bench_get_colors_hex():
+    try:
+        import numpy as np
+    except ImportError:
+        raise Skip("numpy not installed")
+    from gauges.colors import get_colors
+    values = np.random.default_rng(0).uniform(0, 100, 100_000)
+    return lambda: get_colors(values, "hex")
+
+
+@benchmark("color", "colors.get_colors rgba x100k")
+def _bench_get_colors_rgba():
+    try:
+        import numpy as np
+    except ImportError:
+        raise Skip("numpy not installed")
+    from gauges.colors import get_colors
+    values = np.random.default_rng(0).uniform(0, 100, 100_000)
+    return lambda: get_colors(values, "rgba")
+
+
+# Tk canvas
+
+_tk_root = None
+
+
+def _tk_canvas():
+    global _tk_root
+    import tkinter as tk
+    if _tk_root is None:
+        try:
+            _tk_root = tk.Tk()
+        except tk.TclError as e:
+            raise Skip(f"no display: {e}")
+        _tk_root.withdraw()
+    canvas = tk.Canvas(_tk_root, width=300, height=300)
+    return canvas
+
+
+def _cycle(values):
+    state = {"i": 0}
+
+    def next_value():
+        state["i"] = (state["i"] + 1) % len(values)
+        return values[state["i"]]
+    return next_value
+
+
+@benchmark("tk", "slider4 draw_gauge (ArcGauge.set)")
+def _bench_draw_gauge():
+    from gauges.tk_gauges import ArcGauge
+    canvas = _tk_canvas()
+    gauge = ArcGauge(canvas)
+    next_value = _cycle(_percentages())
+
+    def run():
+        gauge.set(next_value())
+        canvas.update_idletasks()
+    return run
+
+
+@benchmark("tk", "slider3 draw_pie_chart (PieChart.set)")
+def _bench_draw_pie_chart():
+    from gauges.tk_gauges import PieChart
+    canvas = _tk_canvas()
+    pie = PieChart(canvas)
+    next_value = _cycle(_percentages())
+
+    def run():
+        pie.set(next_value())
+        canvas.update_idletasks()
+    return run
+
+
+# matplotlib on Agg
+
+def _agg_figure_bench(filename, func_name, loader):
+    try:
+        import matplotlib
+    except ImportError:
+        raise Skip("matplotlib not installed")
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    visualize = loader(filename, func_name)
+    next_value = _cycle(_percentages(11))
+
+    def run():
+        visualize("CPU\nnode-01", next_value())
+        plt.gcf().savefig(io.BytesIO(), format="png")
+        plt.close("all")
+    return run
+
+
+@benchmark("matplotlib", "sliderV2-1 figure create+save")
+def _bench_v2_1():
+    return _agg_figure_bench("sliderV2-1.py", "visualize_percentage",
+                             lambda f, n: load_functions(f, n, "draw_percentage")[0])
+
+
+@benchmark("matplotlib", "sliderV2-2 figure create+save")
+def _bench_v2_2():
+    return _agg_figure_bench("sliderV2-2.py", "visualize_percentage",
+                             lambda f, n: load_functions(f, n, "draw_percentage")[0])
+
+
+@benchmark("matplotlib", "sliderV3-1 figure create+save")
+def _bench_v3_1():
+    return _agg_figure_bench("sliderV3-1.py", "visualize_percentage",
+                             lambda f, n: load_script(f)[n])
+
+
+@benchmark("matplotlib", "sliderV3-2 figure create+save")
+def _bench_v3_2():
+    return _agg_figure_bench("sliderV3-2.py", "visualize_percentage_dial",
+                             lambda f, n: load_script(f)[n])
+
+
+def _reused_figure_bench(style):
+    try:
+        import matplotlib
+    except ImportError:
+        raise Skip("matplotlib not installed")
+    matplotlib.use("Agg")
+    from gauges.batch_render import RENDERERS
+    renderer = RENDERERS[style]()
+    next_value = _cycle(_percentages(11))
+
+    def run():
+        renderer.update("CPU\nnode-01", next_value())
+        renderer.fig.savefig(io.BytesIO(), format="png", dpi=renderer.dpi)
+    return run
+
+
+@benchmark("matplotlib", "batch_render bar reused figure save")
+def _bench_reused_bar():
+    return _reused_figure_bench("bar")
+
+
+@benchmark("matplotlib", "batch_render dial reused figure save")
+def _bench_reused_dial():
+    return _reused_figure_bench("dial")
+
+
+# pygame on the dummy video driver
+
+_pygame_dial = None
+
+
+def _load_pygame_dial():
+    global _pygame_dial
+    if _pygame_dial is None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        try:
+            import pygame  # noqa: F401
+        except ImportError:
+            raise Skip("pygame not installed")
+        _pygame_dial = load_script("sliderV4-1.py")
+        _pygame_dial["setup"]()
+    return _pygame_dial
+
+
+@benchmark("pygame", "sliderV4-1 draw_donut_dial")
+def _bench_draw_donut_dial():
+    dial = _load_pygame_dial()
+    draw_donut_dial, interpolate_color, screen = (
+        dial["draw_donut_dial"], dial["interpolate_color"], dial["screen"])
+    next_value = _cycle(_percentages())
+
+    def run():
+        p = next_value()
+        draw_donut_dial(screen, p, interpolate_color(p))
+    return run
+
+
+@benchmark("pygame", "sliderV4-1 draw_text (all slots)")
+def _bench_draw_text():
+    dial = _load_pygame_dial()
+    draw_text, text_slots = dial["draw_text"], dial["text_slots"]
+    dial["draw_text"].__globals__["label_lines"] = ["CPU", "node-01", "rack 7"]
+    dial["draw_text"].__globals__["percentage"] = "42.5"
+
+    def run():
+        text_slots.clear()  # Force every slot to be drawn again
+        draw_text([])
+    return run
+
+
+@benchmark("pygame", "sliderV4-1 render_frame (value changes)")
+def _bench_render_frame():
+    dial = _load_pygame_dial()
+    g = dial["render_frame"].__globals__
+    g["input_active"] = False
+    values = [f"{p:.1f}" for p in _percentages()]
+    next_value = _cycle(values)
+
+    def run():
+        g["percentage"] = next_value()
+        g["render_frame"]()
+    return run
+
+
+def run_benchmarks(pattern=None, min_time=0.2, repeat=5):
+    """Run the registered benchmarks whose group or name contains pattern."""
+    results = []
+    for group, name, setup in _benchmarks:
+        if pattern and pattern not in group and pattern not in name:
+            continue
+        entry = {"group": group, "name": name}
+        try:
+            func = setup()
+        except Skip as e:
+            entry["skipped"] = str(e)
+        else:
+            calls, samples = time_call(func, min_time, repeat)
+            entry.update(calls=calls, repeat=repeat, min_s=min(samples),
+                         median_s=statistics.median(samples),
+                         stdev_s=statistics.stdev(samples) if len(samples) > 1 else 0.0)
+        results.append(entry)
+        _print_result(entry)
+    return results
+
+
+def _print_result(entry):
+    label = f"[{entry['group']}] {entry['name']}"
+    if "skipped" in entry:
+        print(f"{label:<60} skipped: {entry['skipped']}")
+    else:
+        print(f"{label:<60} {entry['median_s'] * 1e6:12.2f} us/call")
+
+
+def environment():
+    """Describe the interpreter and toolkit versions for the JSON report."""
+    versions = {}
+    for module in ("numpy", "matplotlib", "seaborn", "pygame"):
+        try:
+            versions[module] = __import__(module).__version__
+        except (ImportError, AttributeError):
+            versions[module] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "versions": versions,
+    }
+
+
+def compare(results, baseline, threshold=0.10):
+    """Print median ratios against a baseline run; return the names that regressed."""
+    previous = {r["name"]: r for r in baseline["results"] if "median_s" in r}
+    regressed = []
+    for entry in results:
+        old = previous.get(entry["name"])
+        if old is None or "median_s" not in entry:
+            continue
+        ratio = entry["median_s"] / old["median_s"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressed.append(entry["name"])
+        print(f"{entry['name']:<60} {ratio:6.2f}x{flag}")
+    return regressed
+
+
+def main(argv=None):
+    """Run the suite and optionally write or compare JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark the gauge color and drawing paths.")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--filter", help="Only run benchmarks whose group or name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.filter, args.min_time, args.repeat)
+    report = {"environment": environment(), "results": results}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Single entry point for every gauge backend.
+
+The backend is chosen at runtime and only its own toolkit is imported:
+this module and the package import nothing heavier than the standard
+library, and each backend script imports tkinter, pygame or matplotlib
+itself when it runs.
+
+Usage:
+    python -m gauges canvas-gauge --feed tcp:9000
+    python -m gauges mpl-polar
+    python -m gauges --list
+    python -m gauges --check-startup            # measure every backend
+    python -m gauges --check-startup pygame-donut
+"""
+import argparse
+import os
+import runpy
+import subprocess
+import sys
+from collections import namedtuple
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Backend = namedtuple("Backend", "script modules budget description")
+
+# Cold-start budget: seconds from a fresh interpreter to having the
+# backend's toolkit imported, measured by --check-startup.
+BACKENDS = {
+    "tk-scale": Backend("slider.py", ("tkinter",), 0.25, "Tk scale colored by percentage"),
+    "ttk-progress": Backend("slider2.py", ("tkinter", "tkinter.ttk"), 0.25, "ttk progress bar"),
+    "canvas-pie": Backend("slider3.py", ("tkinter",), 0.25, "Tk canvas pie chart"),
+    "canvas-gauge": Backend("slider4.py", ("tkinter",), 0.25, "Tk canvas 270 degree gauge"),
+    "mpl-bar": Backend("sliderV3-1.py", ("matplotlib.pyplot", "seaborn"), 1.5, "matplotlib bar (terminal input)"),
+    "mpl-polar": Backend("sliderV3-2.py", ("matplotlib.pyplot", "seaborn"), 1.5, "matplotlib polar dial (terminal input)"),
+    "pygame-donut": Backend("sliderV4-1.py", ("pygame",), 0.6, "pygame donut dial"),
+}
+
+# Modules that must never be imported just to start the CLI
+HEAVY_MODULES = ("tkinter", "pygame", "matplotlib", "seaborn", "numpy")
+
+CLI_BUDGET = 0.1  # Seconds to import gauges.cli in a fresh interpreter
+
+_TIMING_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+print(time.perf_counter() - start)
+"""
+
+_CLI_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import gauges.cli
+elapsed = time.perf_counter() - start
+heavy = [m for m in %r if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def run_backend(name, args=()):
+    """Run a backend script as __main__ with the remaining arguments."""
+    backend = BACKENDS[name]
+    script = os.path.join(REPO_DIR, backend.script)
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    sys.argv = [script, *args]
+    runpy.run_path(script, run_name="__main__")
+
+
+def _fresh_python(code, *args):
+    """Run code in a new interpreter from the repo root and return its last output line."""
+    result = subprocess.run([sys.executable, "-c", code, *args], cwd=REPO_DIR,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1]
+
+
+def measure_startup(name, repeat=3):
+    """Return the best-of-repeat toolkit import time for a backend, in seconds."""
+    modules = BACKENDS[name].modules
+    return min(float(_fresh_python(_TIMING_SNIPPET, *modules)) for _ in range(repeat))
+
+
+def check_startup(names=None, repeat=3):
+    """Measure cold-start times against their budgets. Returns True if all pass."""
+    ok = True
+    elapsed, heavy = _fresh_python(_CLI_SNIPPET % (HEAVY_MODULES,)).partition(" ")[::2]
+    status = "ok" if float(elapsed) <= CLI_BUDGET and not heavy else "OVER"
+    ok &= status == "ok"
+    print(f"{'gauges.cli':<14} {float(elapsed) * 1000:8.1f} ms  budget {CLI_BUDGET * 1000:6.0f} ms  {status}"
+          + (f"  (imported {heavy})" if heavy else ""))
+
+    for name in names or BACKENDS:
+        try:
+            seconds = measure_startup(name, repeat)
+        except subprocess.CalledProcessError:
+            print(f"{name:<14} {'n/a':>8}     toolkit not installed")
+            ok = False
+            continue
+        budget = BACKENDS[name].budget
+        status = "ok" if seconds <= budget else "OVER"
+        ok &= status == "ok"
+        print(f"{name:<14} {seconds * 1000:8.1f} ms  budget {budget * 1000:6.0f} ms  {status}")
+    return ok
+
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def positive_float(text):
+    """argparse type for rates that must be above 0."""
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be above 0, got {value}")
+    return value
+
+
+def main(argv=None):
+    """Parse the command line and launch or measure a backend."""
+    parser = argparse.ArgumentParser(prog="python -m gauges",
+                                     description="Show a percentage gauge with the chosen backend.")
+    parser.add_argument("backend", nargs="?", choices=sorted(BACKENDS))
+    parser.add_argument("--list", action="store_true", help="List the available backends")
+    parser.add_argument("--check-startup", nargs="*", metavar="BACKEND",
+                        help="Measure cold-start import time against the budget")
+    args, rest = parser.parse_known_args(argv)
+
+    if args.list:
+        for name, backend in BACKENDS.items():
+            print(f"{name:<14} {backend.description}")
+        return 0
+    if args.check_startup is not None:
+        unknown = [name for name in args.check_startup if name not in BACKENDS]
+        if unknown:
+            parser.error(f"unknown backend(s): {', '.join(unknown)}")
+        return 0 if check_startup(args.check_startup) else 1
+    if args.backend is None:
+        parser.error("choose a backend, or use --list")
+    run_backend(args.backend, rest)
+    return 0
@@ -0,0 +1,107 @@
+"""Red -> orange -> green color ramp shared by all gauge scripts.
+
+The ramp is precomputed once into a lookup table with STEPS_PER_PERCENT
+entries per percent. Scalar lookups index the table directly; get_colors
+maps whole NumPy arrays in one vectorized call. NumPy is only imported
+when an array lookup is made, so the Tk scripts do not pay for it.
+"""
+from functools import lru_cache
+
+RED = (255, 0, 0)
+ORANGE = (255, 165, 0)
+GREEN = (0, 255, 0)
+
+STEPS_PER_PERCENT = 100  # 0.01% resolution
+LUT_SIZE = 100 * STEPS_PER_PERCENT + 1
+
+FORMATS = ("rgb", "rgba", "float", "hex")
+
+
+def interpolate_color(value, min_val, max_val, color1, color2):
+    """Interpolate between two colors based on a value."""
+    ratio = (value - min_val) / (max_val - min_val)
+    r = int(color1[0] + (color2[0] - color1[0]) * ratio)
+    g = int(color1[1] + (color2[1] - color1[1]) * ratio)
+    b = int(color1[2] + (color2[2] - color1[2]) * ratio)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def _ramp(percentage):
+    """Exact ramp value used to fill the lookup table."""
+    if percentage <= 50:
+        color1, color2, ratio = RED, ORANGE, percentage / 50
+    else:
+        color1, color2, ratio = ORANGE, GREEN, (percentage - 50) / 50
+    return tuple(int(c1 + (c2 - c1) * ratio) for c1, c2 in zip(color1, color2))
+
+
+def _build_lut():
+    """Pack the ramp into a flat bytes object, three bytes per entry."""
+    out = bytearray()
+    for i in range(LUT_SIZE):
+        out.extend(_ramp(i / STEPS_PER_PERCENT))
+    return bytes(out)
+
+
+_LUT = _build_lut()
+
+
+@lru_cache(maxsize=None)
+def _hex_table():
+    """Hex strings for every table entry, built on first use."""
+    return [f'#{_LUT[i]:02x}{_LUT[i + 1]:02x}{_LUT[i + 2]:02x}' for i in range(0, len(_LUT), 3)]
+
+
+@lru_cache(maxsize=None)
+def _np_tables():
+    """NumPy views of the table: uint8 RGB, uint8 RGBA, float RGB and hex."""
+    import numpy as np
+    rgb = np.frombuffer(_LUT, dtype=np.uint8).reshape(-1, 3)
+    rgba = np.concatenate([rgb, np.full((LUT_SIZE, 1), 255, dtype=np.uint8)], axis=1)
+    return {
+        "rgb": rgb,
+        "rgba": rgba,
+        "float": rgb / 255.0,
+        "hex": np.array(_hex_table(), dtype="<U7"),
+    }
+
+
+def lut_index(percentage):
+    """Table index for a scalar percentage, clamped to 0-100; NaN maps to 0 as in get_colors."""
+    if not percentage > 0:  # Also catches NaN, which fails every comparison
+        return 0
+    if percentage >= 100:
+        return LUT_SIZE - 1
+    return int(percentage * STEPS_PER_PERCENT + 0.5)
+
+
+def get_color_rgb(percentage):
+    """Return the color for a percentage as an (r, g, b) tuple of ints."""
+    i = 3 * lut_index(percentage)
+    return _LUT[i], _LUT[i + 1], _LUT[i + 2]
+
+
+def get_color_float(percentage):
+    """Return the color for a percentage as an (r, g, b) tuple of 0-1 floats."""
+    r, g, b = get_color_rgb(percentage)
+    return (r / 255, g / 255, b / 255)
+
+
+def get_color(percentage):
+    """Determine the color based on percentage (0% red, 50% orange, 100% green)."""
+    return _hex_table()[lut_index(percentage)]
+
+
+def get_colors(percentages, fmt="rgb"):
+    """Map an array of percentages to colors in one vectorized lookup.
+
+    fmt is one of "rgb" (uint8, shape (..., 3)), "rgba" (uint8, shape (..., 4)),
+    "float" (float64 0-1, shape (..., 3)) or "hex" (strings, same shape as input).
+    NaN is treated as 0%.
+    """
+    import numpy as np
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown color format {fmt!r}, expected one of {FORMATS}")
+    p = np.nan_to_num(np.asarray(percentages, dtype=np.float64), nan=0.0)
+    index = np.floor(np.clip(p, 0, 100) * STEPS_PER_PERCENT + 0.5).astype(np.intp)
+    return _np_tables()[fmt][index]
@@ -0,0 +1,233 @@
+"""Multi-process gauge wall composited in shared memory.
+
+One process cannot redraw thousands of gauges per frame, because the
+NumPy rasterizer spends part of each gauge holding the GIL. Here the
+wall is split into contiguous shards of gauges, and each shard has its
+own worker process. Every worker draws its shard with gauges.raster
+(donut, arc or pie) directly into one multiprocessing.shared_memory
+framebuffer. The presenter wraps that memory in a pygame Surface with
+pygame.image.frombuffer and blits it to the window. No pixels are
+pickled, piped or copied between processes.
+
+The framebuffer and the per-gauge values are both double-buffered, and
+one Barrier per frame keeps everyone in step. At barrier k:
+
+    workers    have finished frame k-1 in buffer (k-1) % 2, and start
+               frame k from values[k % 2] into pixels[k % 2]
+    presenter  blits pixels[(k-1) % 2] and fills values[(k+1) % 2]
+
+Rendering one frame therefore overlaps with presenting the previous one.
+A worker redraws only the gauges whose quantized value differs from what
+that buffer last showed.
+
+Usage:
+    python -m gauges.compositor --count 2000 --workers 4 --style donut
+    python -m gauges.compositor --count 5000 --frames 300 --fps 0
+"""
+import argparse
+import math
+import multiprocessing as mp
+import os
+import random
+import time
+from functools import lru_cache
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from gauges.cli import positive_int
+
+STYLES = ("donut", "arc", "pie")
+BACKGROUND = 255
+CACHE_FRAMES = 256     # Rendered gauges kept per worker, keyed by 0.1% step
+BARRIER_TIMEOUT = 10.0  # Seconds the presenter waits before assuming a worker died
+
+
+def _render_shard(pixels_shm, values_shm, shape, count, style, size, columns,
+                  start, stop, barrier, stop_event):
+    """Worker loop: draw gauges start..stop-1 into the shared framebuffer each frame."""
+    from gauges.raster import get_raster
+    raster = get_raster(style, size)
+
+    @lru_cache(maxsize=CACHE_FRAMES)
+    def gauge(key):
+        return raster.render(key / 10)[..., :3]
+
+    pixels = np.ndarray(shape, dtype=np.uint8, buffer=pixels_shm.buf)
+    values = np.ndarray((2, count), dtype=np.float32, buffer=values_shm.buf)
+    shown = np.full((2, stop - start), -1, dtype=np.int32)  # Key last drawn per buffer
+    frame = 0
+    try:
+        while True:
+            barrier.wait()
+            if stop_event.is_set():
+                break
+            b = frame % 2
+            keys = (np.clip(values[b, start:stop], 0, 100) * 10 + 0.5).astype(np.int32)
+            for j in np.flatnonzero(keys != shown[b]):
+                row, col = divmod(start + int(j), columns)
+                pixels[b, row * size:(row + 1) * size, col * size:(col + 1) * size] = gauge(int(keys[j]))
+            shown[b] = keys
+            frame += 1
+    except BrokenBarrierError:
+        pass  # The presenter aborted
+    finally:
+        del pixels, values  # Release the buffer exports before closing
+        pixels_shm.close()
+        values_shm.close()
+
+
+class Compositor:
+    """Gauge wall rendered by worker processes into a shared framebuffer.
+
+    Set percentages in the values array (one float per gauge), then call
+    step() once per frame. step() starts rendering those values and
+    returns the index of the buffer holding the previous frame. See
+    buffer() for the (height, width, 3) array; it shares memory with the
+    workers. Finish using it before the next step(), because the workers
+    redraw that buffer during that step.
+    """
+
+    def __init__(self, count, style="donut", size=96, columns=None, workers=None):
+        if count < 1 or size < 1:
+            raise ValueError(f"count and size must be at least 1, got {count} and {size}")
+        self.count = count
+        self.size = size
+        self.columns = columns or max(1, math.ceil(math.sqrt(count)))
+        self.rows = -(-count // self.columns)
+        self.width, self.height = self.columns * size, self.rows * size
+        self.workers = max(1, min(workers or os.cpu_count() or 1, count))
+        self.frames = 0
+        self.wait_time = 0.0  # Seconds the presenter spent waiting for workers
+
+        shape = (2, self.height, self.width, 3)
+        self._pixels_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        try:
+            self._values_shm = shared_memory.SharedMemory(create=True, size=2 * count * 4)
+        except OSError:
+            self._pixels_shm.close()
+            self._pixels_shm.unlink()
+            raise
+        self._pixels = np.ndarray(shape, dtype=np.uint8, buffer=self._pixels_shm.buf)
+        self._values = np.ndarray((2, count), dtype=np.float32, buffer=self._values_shm.buf)
+        self._pixels[:] = BACKGROUND
+        self._values[:] = 0
+        self.values = self._values[0]
+
+        self._barrier = mp.Barrier(self.workers + 1)
+        self._stop = mp.Event()
+        bounds = np.linspace(0, count, self.workers + 1).astype(int)
+        self._processes = [
+            mp.Process(target=_render_shard, daemon=True,
+                       args=(self._pixels_shm, self._values_shm, shape, count, style, size,
+                             self.columns, int(start), int(stop), self._barrier, self._stop))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for process in self._processes:
+            process.start()
+
+    def buffer(self, index):
+        """Pixels of framebuffer 0 or 1, for wrapping in a Surface once."""
+        return self._pixels[index]
+
+    def step(self):
+        """Start rendering the current values; returns the index of the finished buffer, or None.
+
+        The first call returns None because no frame has been finished yet.
+        """
+        started = time.perf_counter()
+        try:
+            self._barrier.wait(BARRIER_TIMEOUT)
+        except BrokenBarrierError:
+            raise RuntimeError("a compositor worker stopped responding") from None
+        self.wait_time += time.perf_counter() - started
+        k = self.frames
+        self.frames += 1
+        # Carry values over so callers only need to write the ones that changed
+        self._values[(k + 1) % 2] = self._values[k % 2]
+        self.values = self._values[(k + 1) % 2]
+        return None if k == 0 else (k - 1) % 2
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        self._stop.set()
+        try:
+            self._barrier.wait(BARRIER_TIMEOUT)
+        except BrokenBarrierError:
+            pass
+        for process in self._processes:
+            process.join(BARRIER_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        del self._pixels, self._values, self.values
+        for shm in (self._pixels_shm, self._values_shm):
+            shm.close()
+            shm.unlink()
+
+
+def _random_walk(values, fraction):
+    """Demo data: nudge a fraction of the gauges."""
+    count = len(values)
+    changed = np.array(random.sample(range(count), max(1, int(count * fraction))))
+    values[changed] = np.clip(values[changed] + np.random.uniform(-5, 5, len(changed)), 0, 100)
+
+
+def _fraction(text):
+    """argparse type for a share of the gauges: more than 0, at most 1."""
+    value = float(text)
+    if not 0 < value <= 1:
+        raise argparse.ArgumentTypeError(f"must be more than 0 and at most 1, got {value}")
+    return value
+
+
+def main(argv=None):
+    """Open a pygame window showing a gauge wall rendered by worker processes."""
+    parser = argparse.ArgumentParser(description="Gauge wall rendered by worker processes into shared memory.")
+    parser.add_argument("--style", choices=STYLES, default="donut")
+    parser.add_argument("--count", type=positive_int, default=400, help="Number of gauges")
+    parser.add_argument("--size", type=positive_int, default=64, help="Gauge size in pixels")
+    parser.add_argument("--columns", type=positive_int, help="Gauges per row (default: square wall)")
+    parser.add_argument("--workers", type=positive_int, help="Render processes (default: one per CPU)")
+    parser.add_argument("--fraction", type=_fraction, default=0.1, help="Share of gauges changed per frame")
+    parser.add_argument("--fps", type=float, default=60, help="Target frame rate, 0 for unlimited")
+    parser.add_argument("--frames", type=int, help="Exit after this many frames and print the rate")
+    args = parser.parse_args(argv)
+
+    import pygame
+    compositor = Compositor(args.count, args.style, args.size, args.columns, args.workers)
+    compositor.values[:] = np.random.uniform(0, 100, args.count)
+    pygame.init()
+    screen = pygame.display.set_mode((compositor.width, compositor.height))
+    pygame.display.set_caption(f"Gauge wall: {args.count} gauges, {compositor.workers} workers")
+    size = (compositor.width, compositor.height)
+    # Surfaces share memory with the framebuffers, so blitting reads the workers' pixels
+    surfaces = [pygame.image.frombuffer(compositor.buffer(i), size, "RGB") for i in (0, 1)]
+    clock = pygame.time.Clock()
+    started = time.perf_counter()
+    try:
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    running = False
+            _random_walk(compositor.values, args.fraction)
+            finished = compositor.step()
+            if finished is not None:
+                screen.blit(surfaces[finished], (0, 0))
+                pygame.display.flip()
+            if args.frames and compositor.frames >= args.frames:
+                running = False
+            clock.tick(args.fps)
+    finally:
+        elapsed = time.perf_counter() - started
+        frames = compositor.frames
+        print(f"{frames} frames in {elapsed:.1f} s: {frames / elapsed:.1f} FPS, "
+              f"{compositor.wait_time / max(frames, 1) * 1000:.1f} ms/frame waiting for workers")
+        surfaces.clear()
+        compositor.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Virtualized multi-gauge dashboard.
+
+Lays out any number of slider4-style arc gauges or slider2-style progress
+bars in a scrollable grid. Only the cells inside the visible viewport hold
+canvas items or widgets; they are pooled and reassigned as the view
+scrolls, while offscreen metrics keep just their label and percentage.
+
+Usage:
+    python -m gauges.dashboard --count 5000 --style gauge
+    python -m gauges.dashboard --style bar --feed tcp:9000
+    python -m gauges.dashboard --style raster --count 20000
+"""
+import argparse
+import random
+import tkinter as tk
+from functools import partial
+from tkinter import ttk
+
+from gauges.cli import positive_int
+from gauges.feed import start_feed
+from gauges.tk_gauges import ArcGauge
+from gauges.ttk_styles import ProgressStylePool
+
+STYLES = ("gauge", "bar", "raster")  # raster: gauges.framebuffer.RasterDashboard
+
+
+class GaugeCell:
+    """Pooled cell showing an ArcGauge with its label underneath."""
+
+    WIDTH, HEIGHT = 150, 160
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.gauge = ArcGauge(canvas, self.WIDTH / 2, 70, radius=50)
+        self.text = canvas.create_text(self.WIDTH / 2, 140, text="", width=self.WIDTH - 10,
+                                       justify="center", font=("TkDefaultFont", 8))
+        self.items = self.gauge.items + (self.text,)
+
+    def place(self, x, y):
+        """Move the cell so its top-left corner is at (x, y)."""
+        self.gauge.move_to(x + self.WIDTH / 2, y + 70)
+        self.canvas.coords(self.text, x + self.WIDTH / 2, y + 140)
+
+    def show(self, label, percentage):
+        """Display a metric in this cell."""
+        self.gauge.set(percentage)
+        self.canvas.itemconfig(self.text, text=label)
+
+    def set_visible(self, visible):
+        """Show or hide the cell's canvas items."""
+        state = "normal" if visible else "hidden"
+        for item in self.items:
+            self.canvas.itemconfig(item, state=state)
+
+
+class BarCell:
+    """Pooled cell showing a label next to a ttk progress bar colored by value."""
+
+    WIDTH, HEIGHT = 300, 36
+    STYLE = "Custom.Horizontal.TProgressbar"
+
+    def __init__(self, canvas, styles):
+        self.canvas = canvas
+        self.styles = styles
+        self.text = canvas.create_text(0, 0, text="", anchor="w", width=110,
+                                       font=("TkDefaultFont", 8))
+        self.bar = ttk.Progressbar(canvas, orient="horizontal", length=170,
+                                   mode="determinate", style=self.STYLE)
+        self.window = canvas.create_window(0, 0, window=self.bar, anchor="w")
+        self.items = (self.text, self.window)
+
+    def place(self, x, y):
+        """Move the cell so its top-left corner is at (x, y)."""
+        self.canvas.coords(self.text, x + 5, y + self.HEIGHT / 2)
+        self.canvas.coords(self.window, x + 120, y + self.HEIGHT / 2)
+
+    def show(self, label, percentage):
+        """Display a metric in this cell."""
+        self.canvas.itemconfig(self.text, text=label.replace("\n", " "))
+        self.bar["value"] = percentage
+        self.styles.apply(self.bar, percentage)
+
+    def set_visible(self, visible):
+        """Show or hide the cell's canvas items."""
+        state = "normal" if visible else "hidden"
+        for item in self.items:
+            self.canvas.itemconfig(item, state=state)
+
+
+CELLS = {"gauge": GaugeCell, "bar": BarCell}
+
+
+class Dashboard:
+    """Scrollable grid that only materializes cells for visible metrics."""
+
+    def __init__(self, master, style="gauge", padding=6):
+        if style not in CELLS:
+            raise ValueError(f"Unknown style {style!r}, expected one of {tuple(CELLS)}")
+        self.cell_class = CELLS[style]
+        self.make_cell = self.cell_class
+        self.cell_width = self.cell_class.WIDTH + padding
+        self.cell_height = self.cell_class.HEIGHT + padding
+        if style == "bar":
+            ttk_style = ttk.Style(master)
+            ttk_style.configure(BarCell.STYLE, thickness=14)
+            self.make_cell = partial(BarCell, styles=ProgressStylePool(ttk_style, BarCell.STYLE))
+
+        # Numeric state for every metric
+        self.labels = []
+        self.index = {}
+        self.values = []
+
+        # Live cells for visible metrics, and a pool of spare ones
+        self.cells = {}
+        self.spare = []
+        self.columns = 1
+        self._refresh_pending = False
+
+        self.frame = tk.Frame(master)
+        self.canvas = tk.Canvas(self.frame, background="white", highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._on_scroll)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self._relayout())
+        self.canvas.bind_all("<MouseWheel>", self._on_wheel)
+        self.canvas.bind_all("<Button-4>", lambda event: self._on_scroll("scroll", -3, "units"))
+        self.canvas.bind_all("<Button-5>", lambda event: self._on_scroll("scroll", 3, "units"))
+
+    def pack(self, **kwargs):
+        """Pack the dashboard frame into its master."""
+        self.frame.pack(**kwargs)
+
+    def set(self, label, percentage):
+        """Record a metric value, updating its cell only if it is on screen."""
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+            self.values.append(percentage)
+            if i % self.columns == 0:
+                self._update_scrollregion()
+            self._schedule_refresh()
+            return
+        self.values[i] = percentage
+        cell = self.cells.get(i)
+        if cell is not None:
+            cell.show(label, percentage)
+
+    def _update_scrollregion(self):
+        rows = -(-len(self.labels) // self.columns)
+        self.canvas.configure(scrollregion=(0, 0, self.columns * self.cell_width, rows * self.cell_height))
+
+    def _relayout(self):
+        """Recompute the column count after a resize and re-place live cells."""
+        columns = max(1, self.canvas.winfo_width() // self.cell_width)
+        if columns != self.columns:
+            self.columns = columns
+            for i, cell in self.cells.items():
+                cell.place(*self._origin(i))
+        self._update_scrollregion()
+        self._schedule_refresh()
+
+    def _origin(self, i):
+        row, column = divmod(i, self.columns)
+        return column * self.cell_width, row * self.cell_height
+
+    def _on_scroll(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_refresh()
+
+    def _on_wheel(self, event):
+        self._on_scroll("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _schedule_refresh(self):
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.canvas.after_idle(self._refresh)
+
+    def visible_range(self):
+        """Return the (start, stop) metric indices inside the viewport."""
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int(top // self.cell_height))
+        last_row = int(bottom // self.cell_height) + 1
+        return first_row * self.columns, min(len(self.labels), last_row * self.columns)
+
+    def _refresh(self):
+        """Release cells that scrolled out of view and bind cells to newly visible metrics."""
+        self._refresh_pending = False
+        start, stop = self.visible_range()
+        for i in [i for i in self.cells if not start <= i < stop]:
+            cell = self.cells.pop(i)
+            cell.set_visible(False)
+            self.spare.append(cell)
+        for i in range(start, stop):
+            if i in self.cells:
+                continue
+            cell = self.spare.pop() if self.spare else self.make_cell(self.canvas)
+            cell.place(*self._origin(i))
+            cell.show(self.labels[i], self.values[i])
+            cell.set_visible(True)
+            self.cells[i] = cell
+
+
+def _random_walk(root, dashboard, interval_ms=100, fraction=0.01):
+    """Demo data: nudge a fraction of the metrics every interval."""
+    count = len(dashboard.labels)
+    for i in random.sample(range(count), max(1, int(count * fraction))):
+        value = dashboard.values[i] + random.uniform(-5, 5)
+        dashboard.set(dashboard.labels[i], min(100.0, max(0.0, value)))
+    root.after(interval_ms, _random_walk, root, dashboard, interval_ms, fraction)
+
+
+def main(argv=None):
+    """Open a dashboard window with demo metrics or a live feed."""
+    parser = argparse.ArgumentParser(description="Scrollable dashboard of percentage gauges.")
+    parser.add_argument("--style", choices=STYLES, default="gauge")
+    parser.add_argument("--count", type=positive_int, default=5000, help="Number of demo metrics")
+    parser.add_argument("--feed", help="Feed source: -, file:PATH, tcp:PORT or unix:PATH")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    root.title("Percentage Dashboard")
+    root.geometry("960x720")
+    if args.style == "raster":
+        from gauges.framebuffer import RasterDashboard
+        dashboard = RasterDashboard(root)
+    else:
+        dashboard = Dashboard(root, style=args.style)
+    dashboard.pack(fill="both", expand=True)
+
+    if args.feed:
+        start_feed(root, dashboard.set, args.feed)
+    else:
+        for i in range(args.count):
+            dashboard.set(f"service-{i:04d}", random.uniform(0, 100))
+        root.after(100, _random_walk, root, dashboard)
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Streaming data feed for the Tk visualizers.
+
+Reader threads parse (label, percentage) records from stdin, a tailed
+file or a local socket and post them to a LatestValues mailbox. The Tk
+side drains the mailbox from root.after once per display frame, so a
+burst of updates collapses to the latest value per label and the UI never
+falls behind the producers.
+
+Records are one per line, either "label,percentage" or a JSON object
+with "label" and "percentage" keys. Source specs:
+
+    -                 read stdin
+    file:PATH         follow PATH like tail -F (survives rotation and truncation)
+    tcp:PORT          listen on 127.0.0.1:PORT
+    unix:PATH         listen on a Unix-domain socket
+
+Usage from a script:
+    python slider4.py --feed tcp:9000
+"""
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+
+FRAME_MS = 16  # Drain interval, roughly one display frame
+
+
+def parse_record(line):
+    """Parse one feed line into (label, percentage), or None if invalid."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        if line.startswith("{"):
+            data = json.loads(line)
+            label, percentage = str(data["label"]), float(data["percentage"])
+        else:
+            label, _, value = line.rpartition(",")
+            percentage = float(value)
+    except (ValueError, KeyError, TypeError):
+        return None
+    if not 0 <= percentage <= 100:
+        return None
+    # Allow a literal "\n" to separate up to three label lines
+    label = "\n".join(label.replace("\\n", "\n").splitlines()[:3])
+    return label, percentage
+
+
+class LatestValues:
+    """Thread-safe mailbox that keeps only the newest percentage per label."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+        self._latest = None  # (label, percentage) of the most recent put, until drained
+        self.received = 0
+
+    def put(self, label, percentage):
+        """Store a value, replacing any pending value for the same label."""
+        with self._lock:
+            self._values[label] = percentage
+            self._latest = (label, percentage)
+            self.received += 1
+
+    def take_latest(self):
+        """Clear the mailbox and return the most recently put (label, percentage), or None."""
+        with self._lock:
+            latest, self._latest = self._latest, None
+            self._values = {}
+        return latest
+
+    def drain(self):
+        """Return and clear all pending values as a {label: percentage} dict."""
+        with self._lock:
+            values, self._values = self._values, {}
+            self._latest = None
+        return values
+
+
+def _feed_lines(lines, mailbox):
+    """Parse lines from an iterable into the mailbox."""
+    for line in lines:
+        record = parse_record(line)
+        if record is not None:
+            mailbox.put(*record)
+
+
+def read_stdin(mailbox):
+    """Read records from stdin until EOF."""
+    _feed_lines(sys.stdin, mailbox)
+
+
+def tail_file(path, mailbox, from_start=False, poll_interval=0.1):
+    """Follow a file like tail -F.
+
+    When the file is rotated (path now names a different inode), the new
+    file is opened and read from the top. When it is truncated, reading
+    restarts from the top. Until path exists, it is polled for; a file
+    that appears later is read from the top.
+    """
+    while True:
+        try:
+            f = open(path)
+            break
+        except FileNotFoundError:
+            from_start = True  # Everything in a new file is unread
+            time.sleep(poll_interval)
+    try:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        inode = os.fstat(f.fileno()).st_ino
+        partial = ""
+        while True:
+            line = f.readline()
+            if not line:
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    stat = None  # Rotated away; the new file does not exist yet
+                if stat is not None and stat.st_ino != inode:
+                    try:
+                        new = open(path)
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        f.close()
+                        f, inode, partial = new, os.fstat(new.fileno()).st_ino, ""
+                        continue
+                elif stat is not None and stat.st_size < f.tell():
+                    f.seek(0)
+                    partial = ""
+                time.sleep(poll_interval)
+                continue
+            if not line.endswith("\n"):
+                partial += line  # Writer has not finished the line yet
+                continue
+            record = parse_record(partial + line)
+            partial = ""
+            if record is not None:
+                mailbox.put(*record)
+    finally:
+        f.close()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _make_handler(mailbox):
+    class FeedHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            _feed_lines((raw.decode("utf-8", "replace") for raw in self.rfile), mailbox)
+    return FeedHandler
+
+
+def serve_tcp(port, mailbox, host="127.0.0.1"):
+    """Accept line-oriented feed connections on a local TCP port."""
+    with _TCPServer((host, port), _make_handler(mailbox)) as server:
+        server.serve_forever()
+
+
+def serve_unix(path, mailbox):
+    """Accept line-oriented feed connections on a Unix-domain socket."""
+    if os.path.exists(path):
+        os.unlink(path)
+    with _UnixServer(path, _make_handler(mailbox)) as server:
+        server.serve_forever()
+
+
+def start_reader(source, mailbox):
+    """Start a daemon thread reading the given source spec into the mailbox."""
+    if source == "-":
+        target, args = read_stdin, (mailbox,)
+    elif source.startswith("file:"):
+        target, args = tail_file, (source[5:], mailbox)
+    elif source.startswith("tcp:"):
+        target, args = serve_tcp, (int(source[4:]), mailbox)
+    elif source.startswith("unix:"):
+        target, args = serve_unix, (source[5:], mailbox)
+    else:
+        raise ValueError(f"Unknown feed source {source!r}")
+    thread = threading.Thread(target=target, args=args, name=f"feed {source}", daemon=True)
+    thread.start()
+    return thread
+
+
+class FeedPump:
+    """Drain a LatestValues mailbox from the Tk main loop once per frame.
+
+    By default every pending label is applied, for views with one gauge
+    per label. With latest_only, only the most recently put record is
+    applied, for scripts that show a single gauge.
+    """
+
+    def __init__(self, root, apply, mailbox, interval_ms=FRAME_MS, latest_only=False):
+        self.root = root
+        self.apply = apply
+        self.mailbox = mailbox
+        self.interval_ms = interval_ms
+        self.latest_only = latest_only
+        self.applied = 0
+        self._after_id = None
+
+    def start(self):
+        """Begin draining on the Tk main loop."""
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+        return self
+
+    def stop(self):
+        """Stop draining."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        try:
+            if self.latest_only:
+                latest = self.mailbox.take_latest()
+                records = [] if latest is None else [latest]
+            else:
+                records = self.mailbox.drain().items()
+            for label, percentage in records:
+                self.apply(label, percentage)
+                self.applied += 1
+        finally:
+            # Keep pumping even if apply raised; Tk reports the error
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+
+def start_feed(root, apply, source, interval_ms=FRAME_MS, latest_only=False):
+    """Read records from source and call apply(label, percentage) on the Tk loop."""
+    mailbox = LatestValues()
+    start_reader(source, mailbox)
+    return FeedPump(root, apply, mailbox, interval_ms, latest_only).start()
+
+
+def start_feed_from_argv(root, apply, argv=None):
+    """Start a feed if the command line has --feed SOURCE; otherwise return None.
+
+    Used by the single-gauge scripts, so only the newest record is shown.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--feed" not in argv:
+        return None
+    index = argv.index("--feed")
+    if index + 1 >= len(argv):
+        raise SystemExit("--feed needs a source: -, file:PATH, tcp:PORT or unix:PATH")
+    return start_feed(root, apply, argv[index + 1], latest_only=True)
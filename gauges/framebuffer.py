@@ -0,0 +1,244 @@
+"""One-PhotoImage framebuffer backend for dense Tk dashboards.
+
+Instead of four canvas items per gauge, every visible gauge is copied
+into one NumPy RGB framebuffer, and the framebuffer is shown through a
+single tk.PhotoImage. Gauge images come from the memory-mapped sprite
+atlas (gauges.atlas), so drawing a gauge is an array copy. The buffer is
+split into TILE x TILE tiles. Blits mark the tiles they touch, and a
+flush sends only the dirty tiles to Tk, merging neighbouring dirty tiles
+in a row into one binary PPM "put".
+
+RasterDashboard keeps the interface of gauges.dashboard.Dashboard (set,
+pack). Its canvas holds one image item plus a text item per visible
+label, however many metrics there are.
+
+Usage:
+    python -m gauges.dashboard --style raster --count 20000
+"""
+import tkinter as tk
+
+import numpy as np
+
+from gauges.raster import to_ppm_bytes
+
+TILE = 64
+BACKGROUND = (255, 255, 255)
+SCROLL_UNIT = 40  # Pixels per scrollbar arrow click or wheel step
+
+
+class Framebuffer:
+    """RGB pixel buffer that tracks which tiles changed since the last flush."""
+
+    def __init__(self, width, height, tile=TILE, background=BACKGROUND):
+        self.tile = tile
+        self.background = np.array(background, dtype=np.uint8)
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Reallocate for a new size; everything is dirty afterwards."""
+        self.width, self.height = max(1, width), max(1, height)
+        self.pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self.pixels[:] = self.background
+        self.dirty = np.ones((-(-self.height // self.tile), -(-self.width // self.tile)), dtype=bool)
+
+    def mark(self, x0, y0, x1, y1):
+        """Mark the tiles overlapping the pixel box [x0, x1) x [y0, y1) as dirty."""
+        t = self.tile
+        self.dirty[y0 // t:(y1 - 1) // t + 1, x0 // t:(x1 - 1) // t + 1] = True
+
+    def clear(self):
+        """Fill the whole buffer with the background."""
+        self.pixels[:] = self.background
+        self.dirty[:] = True
+
+    def blit(self, image, x, y):
+        """Copy an (h, w, 3 or 4) uint8 image with its top-left at (x, y), clipped.
+
+        Only the RGB channels are copied; gauge sprites have an opaque
+        background, so no blending is needed.
+        """
+        h, w = image.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.pixels[y0:y1, x0:x1] = image[y0 - y:y1 - y, x0 - x:x1 - x, :3]
+        self.mark(x0, y0, x1, y1)
+
+    def dirty_runs(self):
+        """Pixel boxes (x0, y0, x1, y1) covering the dirty tiles, one per run in a tile row.
+
+        The dirty map is cleared as the boxes are produced.
+        """
+        t = self.tile
+        for row in np.flatnonzero(self.dirty.any(axis=1)):
+            cols = np.flatnonzero(self.dirty[row])
+            # Split the dirty columns into runs of consecutive tiles
+            breaks = np.flatnonzero(np.diff(cols) > 1)
+            firsts = np.r_[cols[0], cols[breaks + 1]].tolist()
+            lasts = np.r_[cols[breaks], cols[-1]].tolist()
+            y0, y1 = int(row) * t, min((int(row) + 1) * t, self.height)
+            for first, last in zip(firsts, lasts):
+                yield first * t, y0, min((last + 1) * t, self.width), y1
+        self.dirty[:] = False
+
+    def ppm(self, x0, y0, x1, y1):
+        """Binary PPM bytes for a box of the buffer."""
+        return to_ppm_bytes(self.pixels[y0:y1, x0:x1])
+
+
+class PhotoFramebuffer(Framebuffer):
+    """Framebuffer shown through one tk.PhotoImage."""
+
+    def __init__(self, master, width, height, tile=TILE, background=BACKGROUND):
+        self.photo = tk.PhotoImage(master=master, width=width, height=height)
+        super().__init__(width, height, tile, background)
+
+    def resize(self, width, height):
+        super().resize(width, height)
+        self.photo.configure(width=self.width, height=self.height)
+
+    def flush(self):
+        """Push the dirty tiles to the PhotoImage. Returns the number of puts."""
+        puts = 0
+        for x0, y0, x1, y1 in self.dirty_runs():
+            self.photo.tk.call(self.photo.name, "put", self.ppm(x0, y0, x1, y1),
+                               "-format", "ppm", "-to", x0, y0)
+            puts += 1
+        return puts
+
+
+class RasterDashboard:
+    """Scrollable grid of arc gauges composited into a single PhotoImage."""
+
+    CELL_WIDTH, CELL_HEIGHT = 150, 160  # As gauges.dashboard.GaugeCell
+    GAUGE_CENTER = (75, 70)
+    RADIUS = 50
+
+    def __init__(self, master, padding=6, atlas=None):
+        from gauges.atlas import frame_index, open_atlas, size_for_radius
+        self.frame_index = frame_index
+        self.atlas = atlas or open_atlas("arc", size_for_radius("arc", self.RADIUS))
+        self.cell_width = self.CELL_WIDTH + padding
+        self.cell_height = self.CELL_HEIGHT + padding
+        self.sprite_offset = (self.GAUGE_CENTER[0] - self.atlas.width // 2,
+                              self.GAUGE_CENTER[1] - self.atlas.height // 2)
+
+        self.labels = []
+        self.index = {}
+        self.values = []
+        self.shown = {}       # metric index -> atlas frame currently in the framebuffer
+        self.text_items = []  # Pooled label items, one per visible cell
+        self.columns = 1
+        self.offset = 0       # Scroll position of the viewport, in pixels
+        self._redraw_pending = False
+        self._flush_pending = False
+
+        self.frame = tk.Frame(master)
+        self.canvas = tk.Canvas(self.frame, background="white", highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.framebuffer = PhotoFramebuffer(self.canvas, 1, 1)
+        self.image = self.canvas.create_image(0, 0, image=self.framebuffer.photo, anchor="nw")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind_all("<MouseWheel>", self._on_wheel)
+        self.canvas.bind_all("<Button-4>", lambda event: self._on_scroll("scroll", -1, "units"))
+        self.canvas.bind_all("<Button-5>", lambda event: self._on_scroll("scroll", 1, "units"))
+
+    def pack(self, **kwargs):
+        """Pack the dashboard frame into its master."""
+        self.frame.pack(**kwargs)
+
+    def set(self, label, percentage):
+        """Record a metric value and repaint its gauge if it is on screen."""
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+            self.values.append(percentage)
+            self._schedule_redraw()
+            return
+        self.values[i] = percentage
+        if i in self.shown:
+            self._draw_gauge(i)
+            self._schedule_flush()
+
+    def _origin(self, i):
+        """Top-left corner of cell i in viewport pixels."""
+        row, column = divmod(i, self.columns)
+        return column * self.cell_width, row * self.cell_height - self.offset
+
+    def _content_height(self):
+        return -(-len(self.labels) // self.columns) * self.cell_height
+
+    def visible_range(self):
+        """Return the (start, stop) metric indices inside the viewport."""
+        first_row = self.offset // self.cell_height
+        last_row = (self.offset + self.framebuffer.height) // self.cell_height + 1
+        return first_row * self.columns, min(len(self.labels), last_row * self.columns)
+
+    def _draw_gauge(self, i):
+        frame = self.frame_index(self.values[i])
+        if self.shown.get(i) == frame:
+            return
+        self.shown[i] = frame
+        x, y = self._origin(i)
+        self.framebuffer.blit(self.atlas.frames[frame], x + self.sprite_offset[0], y + self.sprite_offset[1])
+
+    def _on_configure(self, event):
+        self.columns = max(1, event.width // self.cell_width)
+        self.framebuffer.resize(event.width, event.height)
+        self._scroll_to(self.offset)
+
+    def _on_scroll(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * self._content_height()))
+        elif args[0] == "scroll":
+            step = self.framebuffer.height if args[2] == "pages" else SCROLL_UNIT
+            self._scroll_to(self.offset + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        self._on_scroll("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _scroll_to(self, offset):
+        limit = max(0, self._content_height() - self.framebuffer.height)
+        self.offset = min(max(0, offset), limit)
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.canvas.after_idle(self._redraw)
+
+    def _schedule_flush(self):
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.canvas.after_idle(self._flush)
+
+    def _redraw(self):
+        """Recomposite every visible gauge and re-place the pooled labels."""
+        self._redraw_pending = False
+        self.framebuffer.clear()
+        self.shown.clear()
+        start, stop = self.visible_range()
+        for k, i in enumerate(range(start, stop)):
+            self._draw_gauge(i)
+            if k == len(self.text_items):
+                self.text_items.append(self.canvas.create_text(
+                    0, 0, text="", width=self.CELL_WIDTH - 10, justify="center",
+                    font=("TkDefaultFont", 8)))
+            x, y = self._origin(i)
+            self.canvas.coords(self.text_items[k], x + self.CELL_WIDTH / 2, y + 140)
+            self.canvas.itemconfig(self.text_items[k], text=self.labels[i], state="normal")
+        for item in self.text_items[stop - start:]:
+            self.canvas.itemconfig(item, state="hidden")
+
+        content = self._content_height() or 1
+        self.scrollbar.set(self.offset / content, min(1.0, (self.offset + self.framebuffer.height) / content))
+        self._schedule_flush()
+
+    def _flush(self):
+        self._flush_pending = False
+        self.framebuffer.flush()
@@ -0,0 +1,164 @@
+"""Per-phase frame timing for the pygame loop.
+
+FrameTimer keeps the last CAPACITY loop iterations in a fixed-size ring
+of doubles. Each iteration records one duration per phase, measured
+between consecutive mark() calls. From the ring it computes FPS and
+p50/p95/p99 frame times for an on-screen overlay, and it can write the
+frames as a Chrome trace-event JSON file (chrome://tracing, Perfetto).
+
+When timing is off the loop uses NULL_TIMER, whose methods do nothing,
+so an uninstrumented frame costs a few empty calls.
+
+Usage:
+    python sliderV4-1.py --overlay
+    python sliderV4-1.py --trace frames.json
+"""
+import json
+import os
+import sys
+from array import array
+from time import perf_counter
+
+PHASES = ("events", "draw_dial", "draw_text", "draw_history", "flip", "overlay", "sleep")
+CAPACITY = 1200  # 20 s of frames at 60 FPS
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class NullTimer:
+    """Stand-in for FrameTimer when instrumentation is off."""
+
+    enabled = False
+
+    def begin(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end(self, rendered):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class FrameTimer:
+    """Ring buffer of per-phase durations for the most recent frames."""
+
+    enabled = True
+
+    def __init__(self, capacity=CAPACITY, phases=PHASES):
+        self.capacity = capacity
+        self.phases = phases
+        self._column = {phase: i for i, phase in enumerate(phases)}
+        self.starts = array("d", bytes(8 * capacity))
+        self.durations = array("d", bytes(8 * capacity * len(phases)))
+        self.rendered = bytearray(capacity)
+        self.count = 0  # Frames recorded since start, including overwritten ones
+        self.origin = perf_counter()
+        self._row = 0
+        self._last = self.origin
+
+    def begin(self):
+        """Start a new frame, overwriting the oldest one when the ring is full."""
+        now = perf_counter()
+        slot = self.count % self.capacity
+        self.starts[slot] = now
+        self._row = slot * len(self.phases)
+        for i in range(self._row, self._row + len(self.phases)):
+            self.durations[i] = 0.0
+        self._last = now
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase."""
+        now = perf_counter()
+        self.durations[self._row + self._column[phase]] += now - self._last
+        self._last = now
+
+    def end(self, rendered):
+        """Finish the frame; rendered tells whether anything was drawn."""
+        self.rendered[self.count % self.capacity] = bool(rendered)
+        self.count += 1
+
+    def frames(self):
+        """Yield (start, durations, rendered) for recorded frames, oldest first."""
+        n = len(self.phases)
+        recorded = min(self.count, self.capacity)
+        for k in range(self.count - recorded, self.count):
+            slot = k % self.capacity
+            yield self.starts[slot], self.durations[slot * n:(slot + 1) * n], self.rendered[slot]
+
+    def stats(self, window=1.0):
+        """FPS over the last window seconds and frame/work time percentiles in ms.
+
+        Frame time is the whole loop iteration including the sleep; work
+        time excludes the sleep. Only frames that rendered are counted.
+        """
+        sleep = self._column.get("sleep")
+        frame_ms, work_ms, recent = [], [], 0
+        cutoff = perf_counter() - window
+        for start, durations, rendered in self.frames():
+            if not rendered:
+                continue
+            total = sum(durations)
+            frame_ms.append(total * 1000)
+            work_ms.append((total - (durations[sleep] if sleep is not None else 0)) * 1000)
+            if start >= cutoff:
+                recent += 1
+        frame_ms.sort()
+        work_ms.sort()
+        return {
+            "fps": recent / window,
+            "frames": len(frame_ms),
+            "frame_ms": {q: percentile(frame_ms, q) for q in PERCENTILES},
+            "work_ms": {q: percentile(work_ms, q) for q in PERCENTILES},
+        }
+
+    def summary_lines(self):
+        """Overlay text: FPS and p50/p95/p99 frame and work times."""
+        s = self.stats()
+        quantiles = "/".join(f"p{q}" for q in PERCENTILES)
+        frame = "/".join(f"{s['frame_ms'][q]:.1f}" for q in PERCENTILES)
+        work = "/".join(f"{s['work_ms'][q]:.1f}" for q in PERCENTILES)
+        return [f"FPS {s['fps']:.1f}", f"frame {quantiles} {frame} ms", f"work {quantiles} {work} ms"]
+
+    def trace_events(self):
+        """Chrome trace "complete" events for the recorded frames."""
+        events = []
+        pid = os.getpid()
+        for start, durations, rendered in self.frames():
+            ts = (start - self.origin) * 1e6
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": sum(durations) * 1e6,
+                           "pid": pid, "tid": 1, "args": {"rendered": bool(rendered)}})
+            # Phases run in PHASES order within a frame, so they can be laid end to end
+            for phase, duration in zip(self.phases, durations):
+                if duration > 0:
+                    events.append({"name": phase, "ph": "X", "ts": ts, "dur": duration * 1e6,
+                                   "pid": pid, "tid": 1})
+                ts += duration * 1e6
+        return events
+
+    def write_trace(self, path):
+        """Write the recorded frames as a Chrome trace-event JSON file."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
+
+
+def trace_path_from_argv(argv=None):
+    """FILE from --trace FILE on the command line, or None if absent."""
+    argv = sys.argv[1:] if argv is None else argv
+    if "--trace" not in argv:
+        return None
+    index = argv.index("--trace")
+    if index + 1 >= len(argv) or argv[index + 1].startswith("--"):
+        raise SystemExit("--trace needs a file name for the Chrome trace JSON")
+    return argv[index + 1]
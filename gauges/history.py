@@ -0,0 +1,104 @@
+"""Compact per-gauge value history and LTTB downsampling for sparklines.
+
+History is a fixed-capacity ring of (timestamp, percentage) samples in
+two preallocated NumPy arrays (float64 times, float32 values). A day of
+1 Hz samples takes about 1 MiB per gauge, and appending never allocates.
+Updates that arrive faster than the resolution replace the newest sample
+instead of adding one, so a fast feed cannot push older history out.
+
+lttb() reduces a series to a given number of points with Largest-Triangle-
+Three-Buckets (Steinarsson 2013), which keeps peaks and dips that plain
+striding would drop. sparkline_points() uses it to scale the history to
+one point per pixel column for the Tk and pygame sparklines.
+"""
+import time
+
+import numpy as np
+
+DAY = 24 * 60 * 60
+RESOLUTION = 1.0  # Seconds; samples closer together than this are merged
+
+
+class History:
+    """Ring buffer of (timestamp, percentage) samples."""
+
+    def __init__(self, capacity=DAY, resolution=RESOLUTION):
+        self.capacity = capacity
+        self.resolution = resolution
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float32)
+        self.count = 0    # Samples appended since start, including overwritten ones
+        self.version = 0  # Bumped on every change, so views can tell when to redraw
+
+    def append(self, percentage, timestamp=None):
+        """Record a sample, merging it into the newest one if it is too close in time."""
+        timestamp = time.time() if timestamp is None else timestamp
+        last = (self.count - 1) % self.capacity
+        if self.count and timestamp - self.times[last] < self.resolution:
+            self.values[last] = percentage
+        else:
+            slot = self.count % self.capacity
+            self.times[slot] = timestamp
+            self.values[slot] = percentage
+            self.count += 1
+        self.version += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def arrays(self):
+        """(times, values) in chronological order; views unless the ring has wrapped."""
+        if self.count <= self.capacity:
+            return self.times[:self.count], self.values[:self.count]
+        split = self.count % self.capacity
+        return (np.concatenate((self.times[split:], self.times[:split])),
+                np.concatenate((self.values[split:], self.values[:split])))
+
+    @property
+    def nbytes(self):
+        return self.times.nbytes + self.values.nbytes
+
+
+def lttb(x, y, threshold):
+    """Downsample (x, y) to at most threshold points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. The points in between are split
+    into threshold - 2 buckets, and from each bucket the point forming the
+    largest triangle with the previously chosen point and the average of
+    the next bucket is kept.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.intp) + 1
+    edges[-1] = n - 1
+    chosen = np.empty(threshold, dtype=np.intp)
+    chosen[0], chosen[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        a = start + int(area.argmax())
+        chosen[i + 1] = a
+    return x[chosen], y[chosen]
+
+
+def sparkline_points(history, left, top, width, height):
+    """Pixel (x, y) points for the history inside a box, one per column at most.
+
+    Time runs left to right over the recorded span; 0% is at the bottom and
+    100% at the top. Returns a list of (x, y) float tuples, empty when
+    there are fewer than two samples.
+    """
+    if len(history) < 2:
+        return []
+    times, values = history.arrays()
+    times, values = lttb(times, values, max(3, int(width)))
+    span = times[-1] - times[0] or 1.0
+    xs = left + (times - times[0]) * (width / span)
+    ys = top + height - np.clip(values, 0, 100) * (height / 100)
+    return list(zip(xs.tolist(), ys.tolist()))
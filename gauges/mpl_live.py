@@ -0,0 +1,117 @@
+"""Live-updating matplotlib bar and polar dial using blitting.
+
+The figure (axes, ticks, grey arc, title) is drawn once and its pixels are
+cached. Each update restores that background and redraws only the bar
+patch and the percentage text, so a value change costs a blit instead of
+a full redraw plus tight_layout. A label change triggers one full redraw,
+which also refreshes the cached background.
+
+The bar is sliderV3-1's figure and the dial sliderV3-2's. sliderV2-2's
+label-left row layout is a different figure and has no live mode.
+
+Usage:
+    python -m gauges.mpl_live --style dial --feed tcp:9000 --hz 60
+    python -m gauges.mpl_live --style bar           # random demo data
+"""
+import argparse
+import random
+
+from gauges.batch_render import RENDERERS, STYLES
+from gauges.cli import positive_float
+from gauges.feed import LatestValues, start_reader
+
+
+class LiveGauge:
+    """Blitting wrapper around a batch_render bar or dial figure."""
+
+    def __init__(self, style="bar"):
+        self.renderer = RENDERERS[style]()
+        self.fig = self.renderer.fig
+        self.canvas = self.fig.canvas
+        self.animated = (self.renderer.bar, self.renderer.text)
+        for artist in self.animated:
+            artist.set_animated(True)
+        self.label = None
+        self.background = None
+        self.frames = 0
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Cache the static background after any full redraw, then draw the value."""
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self.animated:
+            self.fig.draw_artist(artist)
+
+    def update(self, label, percentage):
+        """Show a new value, blitting when only the percentage changed."""
+        if label != self.label or self.background is None or not self.canvas.supports_blit:
+            self.label = label
+            self.renderer.update(label, percentage)
+            # Any cached background predates this label; blit only after the new full draw
+            self.background = None
+            self.canvas.draw_idle()
+            return
+        self.renderer.update(label, percentage)
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+        self.frames += 1
+
+    def run(self, source, hz=60):
+        """Poll source() up to hz times per second and show its (label, percentage).
+
+        source returns None when there is nothing new to show.
+        """
+        import matplotlib.pyplot as plt
+
+        def tick():
+            value = source()
+            if value is not None:
+                self.update(*value)
+
+        timer = self.canvas.new_timer(interval=max(1, int(1000 / hz)))
+        timer.add_callback(tick)
+        timer.start()
+        plt.show()
+
+
+def mailbox_source(mailbox):
+    """Adapt a LatestValues mailbox to a source returning the most recently updated record."""
+    def source():
+        return mailbox.take_latest()
+    return source
+
+
+def random_walk_source(label="Demo\nrandom walk"):
+    """Demo source: a percentage that drifts randomly every tick."""
+    state = {"value": 50.0}
+
+    def source():
+        state["value"] = min(100.0, max(0.0, state["value"] + random.uniform(-2, 2)))
+        return label, state["value"]
+    return source
+
+
+def main(argv=None):
+    """Open a live gauge fed from a feed source or random demo data."""
+    parser = argparse.ArgumentParser(description="Live matplotlib gauge with blitted updates.")
+    parser.add_argument("--style", choices=STYLES, default="bar")
+    parser.add_argument("--feed", help="Feed source: -, file:PATH, tcp:PORT or unix:PATH")
+    parser.add_argument("--hz", type=positive_float, default=60, help="Maximum updates per second")
+    args = parser.parse_args(argv)
+
+    if args.feed:
+        mailbox = LatestValues()
+        start_reader(args.feed, mailbox)
+        source = mailbox_source(mailbox)
+    else:
+        source = random_walk_source()
+    LiveGauge(args.style).run(source, hz=args.hz)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Frame pacing against absolute deadlines for asyncio render loops.
+
+`await asyncio.sleep(1 / 60)` after the frame's work makes every frame
+last work + 1/60 s, so the loop runs below 60 FPS and slows further
+under load. FrameScheduler instead keeps an absolute deadline on the
+monotonic clock and sleeps only for what is left of the frame. Any
+sleep overshoot is absorbed by the next frame instead of accumulating.
+
+When a frame overruns its deadline, the frames it missed are dropped
+rather than rendered in a burst. The loop keeps handling input and data
+every iteration but skips drawing, at most MAX_SKIP times in a row, so
+an overloaded loop renders less often and still responds to input. With
+adaptive=True the target rate moves between the requested rate and the
+lower RATES, based on a moving average of the work time per frame. It
+goes back to the requested rate after reset().
+
+Only asyncio.sleep and time.monotonic are used, so the same coroutine
+works under asyncio.run and the Emscripten asyncio.ensure_future loop.
+"""
+import asyncio
+import sys
+import time
+
+RATES = (60, 30, 20, 15, 10)  # Divisors of 60 Hz keep frames evenly spaced on common displays
+MAX_SKIP = 4                  # Renders skipped in a row before one is forced
+ADAPT_FRAMES = 30             # Frames between adaptive rate decisions
+SMOOTHING = 0.1               # Weight of the newest frame in the work-time average
+
+
+class FrameScheduler:
+    """Deadline-based frame pacing with frame skipping and optional rate adaptation."""
+
+    def __init__(self, fps=60, adaptive=False, clock=time.monotonic):
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps!r}")
+        self.max_fps = fps
+        # Adaptive steps: the requested rate, then the lower standard rates
+        self.rates = (fps,) + tuple(r for r in RATES if r < fps)
+        self.fps = fps
+        self.interval = 1.0 / fps
+        self.adaptive = adaptive
+        self.clock = clock
+        self.deadline = clock()
+        self.frame_start = self.deadline
+        self.late = False
+        self.work = 0.0     # Moving average of work time per frame, seconds
+        self.dropped = 0    # Deadlines missed entirely
+        self.skipped = 0    # Renders skipped to catch up
+        self._skips_in_row = 0
+        self._frames = 0
+
+    def reset(self):
+        """Restart pacing from now, e.g. after the loop has been idle.
+
+        The load seen before the pause says nothing about the next burst,
+        so an adaptive scheduler goes back to the requested rate.
+        """
+        self.deadline = self.frame_start = self.clock()
+        self.late = False
+        if self.adaptive and self.fps != self.max_fps:
+            self.set_rate(self.max_fps)
+            self.work = 0.0
+
+    def should_render(self):
+        """Whether this frame should draw; False while catching up after an overrun."""
+        if self.late and self._skips_in_row < MAX_SKIP:
+            self._skips_in_row += 1
+            self.skipped += 1
+            return False
+        self._skips_in_row = 0
+        return True
+
+    def set_rate(self, fps):
+        """Change the target rate; takes effect from the next deadline."""
+        self.fps = fps
+        self.interval = 1.0 / fps
+
+    def _adapt(self):
+        lower = [r for r in self.rates if r < self.fps]
+        higher = [r for r in self.rates if r > self.fps]
+        if lower and self.work > 0.9 * self.interval:
+            self.set_rate(lower[0])
+        elif higher and self.work < 0.5 / higher[-1]:
+            self.set_rate(higher[-1])
+
+    async def wait(self):
+        """Sleep until the next frame deadline, dropping deadlines already missed."""
+        now = self.clock()
+        self.work += SMOOTHING * ((now - self.frame_start) - self.work)
+        self._frames += 1
+        if self.adaptive and self._frames % ADAPT_FRAMES == 0:
+            self._adapt()
+
+        self.deadline += self.interval
+        delay = self.deadline - now
+        if delay < 0:
+            # Overran: drop whole frames that are already past, catch up by skipping renders
+            missed = int(-delay / self.interval)
+            self.late = missed > 0
+            self.dropped += missed
+            self.deadline += missed * self.interval
+            await asyncio.sleep(0)  # Still yield so other tasks and the browser can run
+        else:
+            self.late = False
+            await asyncio.sleep(delay)
+        self.frame_start = self.clock()
+
+    def summary(self):
+        """One overlay line with the target rate and catch-up counters."""
+        return f"target {self.fps} Hz, dropped {self.dropped}, skipped {self.skipped}"
+
+
+def fps_from_argv(argv=None, default=60):
+    """Target rate from --fps N on the command line, or default if absent."""
+    argv = sys.argv[1:] if argv is None else argv
+    if "--fps" not in argv:
+        return default
+    index = argv.index("--fps")
+    if index + 1 >= len(argv) or not argv[index + 1].isdigit() or int(argv[index + 1]) < 1:
+        raise SystemExit("--fps needs a positive whole number of frames per second")
+    return int(argv[index + 1])
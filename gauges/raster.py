@@ -0,0 +1,242 @@
+"""Pure-NumPy anti-aliased rasterizer for the donut, pie and arc gauges.
+
+Per-pixel radius and angle fields are computed once per image size. A
+gauge is then a vectorized threshold on angle inside a ring, with
+coverage ramps of one pixel on every edge for anti-aliasing. The static
+layers (background ring, disc or track) are also cached, so render()
+only computes the filled sector and, for the arc, the needle.
+
+Geometry follows the scripts, scaled so the gauge fills the image:
+
+    donut  sliderV4-1 draw_donut_dial: grey ring, inner radius 0.6, fills clockwise from the top
+    pie    slider3 draw_pie_chart: grey disc, slice counter-clockwise from the top
+    arc    slider4 draw_gauge: 270 degree track from 135 degrees, needle and hub
+
+Images are (size, size, 4) uint8 RGBA arrays. to_png_bytes, write_png,
+to_pygame_surface and to_photoimage convert them for each consumer.
+
+Usage:
+    python -m gauges.raster metrics.csv thumbs/ --style donut --size 64
+"""
+import argparse
+import base64
+import os
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from gauges.colors import get_color_rgb
+
+STYLES = ("donut", "pie", "arc")
+
+WHITE = (255, 255, 255, 255)
+TRANSPARENT = (0, 0, 0, 0)
+PYGAME_GRAY = (200, 200, 200)  # GRAY in sliderV4-1.py
+TK_GREY = (190, 190, 190)      # Tk's "grey"
+BLACK = (0, 0, 0)
+
+
+@lru_cache(maxsize=32)
+def polar_field(size, extent):
+    """Radius and angle for every pixel center of a size x size image.
+
+    Returns (x, y, radius, angle, pixel). Coordinates and radius are in
+    gauge units, where the gauge's outermost edge is at extent, with y up.
+    Angle is in radians, counter-clockwise from east, in [0, 2*pi). pixel
+    is the pixel size in gauge units, used for anti-aliasing.
+    """
+    pixel = 2 * extent / size
+    coords = (np.arange(size, dtype=np.float32) + 0.5 - size / 2) * pixel
+    x = coords[np.newaxis, :]
+    y = -coords[:, np.newaxis]
+    radius = np.hypot(x, y)
+    angle = np.mod(np.arctan2(y, x), 2 * np.pi).astype(np.float32)
+    return x, y, radius, angle, np.float32(pixel)
+
+
+def _ring(radius, pixel, r_in, r_out):
+    """Coverage of the ring r_in <= r <= r_out with one-pixel soft edges."""
+    outer = np.clip((r_out - radius) / pixel + 0.5, 0, 1)
+    if r_in <= 0:
+        return outer
+    return outer * np.clip((radius - r_in) / pixel + 0.5, 0, 1)
+
+
+def _sector(radius, angle, pixel, start, sweep, clockwise):
+    """Coverage of the angular sector [start, start + sweep), in radians."""
+    if sweep >= 2 * np.pi:
+        return np.ones_like(radius)
+    if sweep <= 0:
+        return np.zeros_like(radius)
+    offset = (start - angle) if clockwise else (angle - start)
+    a = np.mod(offset, 2 * np.pi)
+    # Signed angular distance inside the start and end edges; points in the
+    # gap are measured against the nearer edge so both edges get soft ramps
+    from_start = np.where(a <= np.pi + sweep / 2, a, a - 2 * np.pi)
+    inside = np.minimum(from_start, sweep - a)
+    return np.clip(inside * np.maximum(radius, pixel) / pixel + 0.5, 0, 1)
+
+
+def _segment(x, y, pixel, x1, y1, width):
+    """Coverage of a line from the center to (x1, y1) with round ends."""
+    length = np.hypot(x1, y1)
+    ux, uy = x1 / length, y1 / length
+    t = np.clip(x * ux + y * uy, 0, length)
+    dist = np.hypot(x - t * ux, y - t * uy)
+    return np.clip((width / 2 - dist) / pixel + 0.5, 0, 1)
+
+
+def _paint(image, coverage, color):
+    """Composite a solid color over a premultiplied float RGBA image."""
+    c = coverage[..., np.newaxis]
+    rgba = np.array([*color[:3], 255 if len(color) < 4 else color[3]], dtype=np.float32) / 255
+    rgba[:3] *= rgba[3]
+    image *= 1 - c * rgba[3]
+    image += c * rgba
+
+
+class GaugeRaster:
+    """Rasterizer for one gauge style at one image size."""
+
+    def __init__(self, style="donut", size=128, background=WHITE, margin=1.5):
+        if style not in STYLES:
+            raise ValueError(f"Unknown style {style!r}, expected one of {STYLES}")
+        self.style = style
+        self.size = size
+        self.outer = 1.05 if style == "arc" else 1.0
+        extent = self.outer * size / (size - 2 * margin)
+        self.extent = extent
+        self.x, self.y, self.radius, self.angle, self.pixel = polar_field(size, extent)
+        self.base = self._static_layers(background)
+
+    def _static_layers(self, background):
+        """Background plus the parts of the gauge that never change."""
+        image = np.zeros((self.size, self.size, 4), dtype=np.float32)
+        _paint(image, np.ones_like(self.radius), background)
+        if self.style == "donut":
+            self.fill_ring = _ring(self.radius, self.pixel, 0.6, 1.0)
+            _paint(image, self.fill_ring, PYGAME_GRAY)
+        elif self.style == "pie":
+            self.fill_ring = _ring(self.radius, self.pixel, 0, 1.0)
+            _paint(image, self.fill_ring, TK_GREY)
+        else:
+            self.fill_ring = _ring(self.radius, self.pixel, 0.95, 1.05)
+            track = self.fill_ring * _sector(self.radius, self.angle, self.pixel,
+                                             np.radians(135), np.radians(270), clockwise=False)
+            _paint(image, track, TK_GREY)
+        return image
+
+    def render_float(self, percentage):
+        """Render to a premultiplied float32 RGBA array in 0-1."""
+        image = self.base.copy()
+        color = get_color_rgb(percentage)
+        if self.style == "donut":
+            sector = _sector(self.radius, self.angle, self.pixel, np.pi / 2,
+                             2 * np.pi * percentage / 100, clockwise=True)
+        elif self.style == "pie":
+            sector = _sector(self.radius, self.angle, self.pixel, np.pi / 2,
+                             2 * np.pi * percentage / 100, clockwise=False)
+        else:
+            sector = _sector(self.radius, self.angle, self.pixel, np.radians(135),
+                             np.radians(270 * percentage / 100), clockwise=False)
+        _paint(image, self.fill_ring * sector, color)
+        if self.style == "arc":
+            angle = np.radians(135 + 270 * percentage / 100)
+            needle = _segment(self.x, self.y, self.pixel,
+                              0.9 * np.cos(angle), 0.9 * np.sin(angle), 0.02)
+            _paint(image, needle, BLACK)
+            _paint(image, _ring(self.radius, self.pixel, 0, 0.05), BLACK)
+        return image
+
+    def render(self, percentage):
+        """Render to a (size, size, 4) uint8 RGBA array."""
+        return to_uint8(self.render_float(percentage))
+
+
+def to_uint8(image):
+    """Convert a premultiplied float RGBA image to straight-alpha uint8."""
+    alpha = image[..., 3:4]
+    rgb = np.divide(image[..., :3], alpha, out=np.zeros_like(image[..., :3]), where=alpha > 0)
+    out = np.concatenate([rgb, alpha], axis=-1)
+    return (out * 255 + 0.5).astype(np.uint8)
+
+
+@lru_cache(maxsize=16)
+def get_raster(style, size, background=WHITE):
+    """Shared GaugeRaster for a style, size and background."""
+    return GaugeRaster(style, size, background)
+
+
+def render(style, percentage, size=128, background=WHITE):
+    """Render a gauge to a (size, size, 4) uint8 RGBA array."""
+    return get_raster(style, size, tuple(background)).render(percentage)
+
+
+def _png_chunk(kind, data):
+    chunk = kind + data
+    return struct.pack(">I", len(data)) + chunk + struct.pack(">I", zlib.crc32(chunk) & 0xFFFFFFFF)
+
+
+def to_png_bytes(rgba, compression=6):
+    """Encode an RGBA uint8 array as PNG bytes using only zlib."""
+    height, width = rgba.shape[:2]
+    # Each scanline is prefixed with filter type 0 (None)
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = np.ascontiguousarray(rgba).reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), compression))
+            + _png_chunk(b"IEND", b""))
+
+
+def to_ppm_bytes(image):
+    """Encode the RGB channels of a uint8 array as binary PPM, the cheapest format Tk parses."""
+    height, width = image.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(image[..., :3]).tobytes()
+
+
+def write_png(path, rgba, compression=6):
+    """Write an RGBA uint8 array to a PNG file."""
+    with open(path, "wb") as f:
+        f.write(to_png_bytes(rgba, compression))
+
+
+def to_pygame_surface(rgba):
+    """Convert an RGBA uint8 array to a pygame Surface."""
+    import pygame
+    height, width = rgba.shape[:2]
+    return pygame.image.frombuffer(np.ascontiguousarray(rgba).tobytes(), (width, height), "RGBA")
+
+
+def to_photoimage(rgba, master=None):
+    """Convert an RGBA uint8 array to a tk.PhotoImage (needs Tk 8.6 PNG support)."""
+    import tkinter as tk
+    data = base64.b64encode(to_png_bytes(rgba, compression=1))
+    return tk.PhotoImage(master=master, data=data, format="png")
+
+
+def main(argv=None):
+    """Write one PNG thumbnail per CSV record, without matplotlib."""
+    from gauges.batch_input import iter_records
+    from gauges.batch_render import output_name
+
+    parser = argparse.ArgumentParser(description="Render gauge thumbnails with the NumPy rasterizer.")
+    parser.add_argument("input", help="CSV (label,percentage) or JSONL file of records")
+    parser.add_argument("out_dir", help="Directory for the PNG files")
+    parser.add_argument("--style", choices=STYLES, default="donut")
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--rejects", help="CSV file for rows that fail validation")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    raster = get_raster(args.style, args.size)
+    count = 0
+    for count, (label, percentage) in enumerate(iter_records(args.input, args.rejects), 1):
+        write_png(os.path.join(args.out_dir, output_name(count - 1, label)), raster.render(percentage))
+    print(f"Wrote {count} images to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Background gauge rendering for the Tk front-ends.
+
+Tk callbacks run on the main thread, so a slow render (a matplotlib
+figure, or many gauges at once) blocks typing and clicking until it
+finishes. RenderPool runs render functions in worker threads (or
+processes) and hands the finished images back to the Tk loop through a
+queue. The queue is drained from root.after once per frame, like
+gauges.feed.FeedPump.
+
+Every submit carries a key, for example the gauge it is for. Each key
+has a generation counter. A newer submit cancels the key's queued job if
+it has not started yet. A result whose generation is no longer the
+newest is dropped, so only the latest value for a key ever reaches the
+screen.
+
+Render functions return image bytes that Tk can read directly:
+render_gauge_ppm (NumPy rasterizer) and render_figure_png (matplotlib on
+Agg, without pyplot). Worker threads keep the Tk loop responsive but do
+not run in parallel with it for long: NumPy releases the GIL only inside
+larger array operations, and Agg holds it while drawing. matplotlib is
+not thread-safe either, so figure rendering uses a single worker. For
+real parallelism use processes, with render functions that can be
+imported by the worker processes.
+
+Usage from a script:
+    python slider4.py --workers 2
+    python sliderV2-1.py --preview
+"""
+import io
+import queue
+import sys
+import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from gauges.feed import FRAME_MS
+
+
+class RenderPool:
+    """Worker pool whose results are applied on the Tk main loop, newest only."""
+
+    def __init__(self, root, workers=2, processes=False, interval_ms=FRAME_MS):
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=workers)
+        self.root = root
+        self.interval_ms = interval_ms
+        self.results = queue.SimpleQueue()
+        self.completed = 0
+        self.discarded = 0
+        self._generation = {}  # key -> newest generation submitted
+        self._futures = {}     # key -> Future of the newest job
+        self._after_id = root.after(interval_ms, self._drain)
+
+    def submit(self, key, apply, render, *args):
+        """Run render(*args) in a worker and call apply(result) on the Tk loop.
+
+        Any earlier job for key that has not started yet is cancelled, and
+        results of earlier jobs that did start are discarded.
+        """
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        previous = self._futures.get(key)
+        if previous is not None:
+            previous.cancel()
+        future = self.executor.submit(render, *args)
+        self._futures[key] = future
+        # Runs in the worker thread (or the pool's result thread); just hand over
+        future.add_done_callback(lambda f: self.results.put((key, generation, apply, f)))
+        return generation
+
+    def _drain(self):
+        while True:
+            try:
+                key, generation, apply, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if future.cancelled() or generation != self._generation.get(key):
+                self.discarded += 1
+                continue
+            del self._futures[key]
+            try:
+                apply(future.result())
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+                continue
+            self.completed += 1
+        self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def shutdown(self):
+        """Stop draining, cancel jobs that have not started and wait for running ones.
+
+        Waiting means a render still in progress cannot overlap whatever the
+        caller draws next, such as a pyplot figure on the main thread.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def render_gauge_ppm(style, size, percentage):
+    """Binary PPM of a gauges.raster gauge; runs in a worker."""
+    from gauges.raster import get_raster, to_ppm_bytes
+    return to_ppm_bytes(get_raster(style, size).render(percentage))
+
+
+def render_figure_png(draw, figsize, dpi, *args):
+    """PNG bytes of a figure drawn by draw(fig, *args) on Agg; runs in a worker thread.
+
+    The figure is not registered with pyplot, so nothing here touches the
+    GUI backend or pyplot's global figure list.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    draw(fig, *args)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+class PooledGauge:
+    """Tk canvas gauge whose images are rendered by a RenderPool.
+
+    Has the same set() interface as the tk_gauges classes. The canvas
+    image changes when the worker finishes, so quick successive values
+    show only the last one.
+    """
+
+    def __init__(self, canvas, pool, style, size, center_x=150, center_y=150):
+        self.canvas = canvas
+        self.pool = pool
+        self.style = style
+        self.size = size
+        self.percentage = None
+        self.photo = None
+        self.item = canvas.create_image(center_x, center_y, anchor="center")
+        self.items = (self.item,)
+
+    def set(self, percentage):
+        """Render percentage in the background; no-op if it is unchanged."""
+        if percentage == self.percentage:
+            return
+        self.percentage = percentage
+        self.pool.submit(self, self._show, render_gauge_ppm, self.style, self.size, percentage)
+
+    def _show(self, ppm):
+        self.photo = tk.PhotoImage(master=self.canvas, data=ppm, format="ppm")
+        self.canvas.itemconfig(self.item, image=self.photo)
+
+    def move_to(self, center_x, center_y):
+        """Move the image so it is centered on (center_x, center_y)."""
+        self.canvas.coords(self.item, center_x, center_y)
+
+    def destroy(self):
+        """Delete the canvas item."""
+        self.canvas.delete(self.item)
+        self.photo = None
+
+
+def workers_from_argv(argv=None):
+    """Worker count from --workers N on the command line, or None if absent."""
+    argv = sys.argv[1:] if argv is None else argv
+    if "--workers" not in argv:
+        return None
+    index = argv.index("--workers")
+    if index + 1 >= len(argv) or not argv[index + 1].isdigit() or int(argv[index + 1]) < 1:
+        raise SystemExit("--workers needs a number of render threads, at least 1")
+    return int(argv[index + 1])
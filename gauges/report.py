@@ -0,0 +1,183 @@
+"""Multi-page PDF and PNG contact-sheet reports with bounded memory.
+
+Two layouts:
+
+    rows    sliderV2-2-style compact rows: label on the left, colored bar on the right
+    dials   sliderV3-2-style polar dials in a grid, label above each dial
+
+Each layout builds ONE page figure (without pyplot, so nothing is kept
+in pyplot's figure registry). It then refills the same artists for every
+page of records and writes the page before reading the next one. A
+50,000-row report therefore holds one page of records and one figure at
+any time. The figure is cleared when the report finishes; with no pyplot
+registry there is nothing else to close.
+
+Usage:
+    python -m gauges.report metrics.csv report.pdf --layout rows
+    python -m gauges.report metrics.jsonl sheets/ --layout dials --png
+"""
+import argparse
+import os
+from itertools import islice
+
+import numpy as np
+
+from gauges.batch_input import iter_records
+from gauges.colors import get_color_float
+
+PAGE_SIZE = (8.27, 11.69)  # A4 portrait, inches
+LAYOUTS = ("rows", "dials")
+
+
+def _new_figure():
+    """A standalone Agg figure that pyplot does not track."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=PAGE_SIZE)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+class RowsPage:
+    """Page of compact label + bar rows, refilled in place for every page."""
+
+    def __init__(self, rows=40):
+        self.per_page = rows
+        self.fig = _new_figure()
+        self.header = self.fig.text(0.5, 0.985, "", ha="center", va="top", fontsize=9)
+        gs = self.fig.add_gridspec(1, 2, width_ratios=[1, 2], left=0.03, right=0.97,
+                                   top=0.96, bottom=0.04, wspace=0.02)
+        self.label_ax = self.fig.add_subplot(gs[0])
+        self.bar_ax = self.fig.add_subplot(gs[1])
+        for ax in (self.label_ax, self.bar_ax):
+            ax.set_ylim(rows - 0.5, -0.5)
+        self.label_ax.axis("off")
+
+        y = np.arange(rows)
+        self.bars = self.bar_ax.barh(y, np.zeros(rows), height=0.6).patches
+        self.labels = [self.label_ax.text(0.02, i, "", va="center", ha="left", fontsize=7)
+                       for i in y]
+        self.values = [self.bar_ax.text(0, i, "", va="center", ha="left", fontsize=6)
+                       for i in y]
+        self.bar_ax.set_xlim(0, 100)
+        self.bar_ax.set_yticks([])
+        self.bar_ax.set_xticks(np.arange(0, 101, 20))
+        self.bar_ax.tick_params(axis="x", labelsize=7)
+        self.bar_ax.grid(axis="x", color="#dddddd")
+        self.bar_ax.set_axisbelow(True)
+
+    def fill(self, records, header):
+        """Point the row artists at a page of (label, percentage) records."""
+        self.header.set_text(header)
+        for i in range(self.per_page):
+            if i < len(records):
+                label, percentage = records[i]
+                self.bars[i].set_width(percentage)
+                self.bars[i].set_color(get_color_float(percentage))
+                self.labels[i].set_text(label.replace("\n", " / "))
+                self.values[i].set_position((percentage + 1, i))
+                self.values[i].set_text(f"{percentage:.1f}%")
+            else:
+                self.bars[i].set_width(0)
+                self.labels[i].set_text("")
+                self.values[i].set_text("")
+
+
+class DialsPage:
+    """Grid of polar dials, refilled in place for every page."""
+
+    def __init__(self, columns=4, rows=8):
+        self.per_page = columns * rows
+        self.fig = _new_figure()
+        self.header = self.fig.text(0.5, 0.985, "", ha="center", va="top", fontsize=9)
+        self.fig.subplots_adjust(left=0.02, right=0.98, top=0.95, bottom=0.02, hspace=0.3, wspace=0.1)
+        self.axes, self.arcs, self.texts, self.titles = [], [], [], []
+        for i in range(self.per_page):
+            ax = self.fig.add_subplot(rows, columns, i + 1, projection="polar")
+            # Upper half-disc only: the track is a ring from 0% (east) to 100% (west)
+            ax.set_thetamin(0)
+            ax.set_thetamax(180)
+            ax.set_ylim(0, 1)
+            ax.barh(0.75, np.pi, color="lightgrey", height=0.4, alpha=0.3)
+            self.arcs.append(ax.barh(0.75, 0, height=0.4, alpha=0.8)[0])
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.grid(False)
+            ax.set_frame_on(False)
+            self.texts.append(ax.text(np.pi / 2, 0.05, "", ha="center", va="bottom",
+                                      fontsize=9, fontweight="bold"))
+            self.titles.append(ax.set_title("", fontsize=6, pad=2))
+            self.axes.append(ax)
+
+    def fill(self, records, header):
+        """Point the dial artists at a page of (label, percentage) records."""
+        self.header.set_text(header)
+        for i, ax in enumerate(self.axes):
+            if i >= len(records):
+                ax.set_visible(False)
+                continue
+            label, percentage = records[i]
+            ax.set_visible(True)
+            self.arcs[i].set_width((percentage / 100) * np.pi)
+            self.arcs[i].set_color(get_color_float(percentage))
+            self.texts[i].set_text(f"{percentage:.1f}%")
+            self.titles[i].set_text(label)
+
+
+PAGES = {"rows": RowsPage, "dials": DialsPage}
+
+
+def _pages(records, per_page):
+    """Yield lists of at most per_page records, reading the input lazily."""
+    it = iter(records)
+    while True:
+        page = list(islice(it, per_page))
+        if not page:
+            return
+        yield page
+
+
+def write_report(records, output, layout="rows", png=False, dpi=100, title="Percentage report"):
+    """Write records page by page to a multi-page PDF, or PNG sheets if png is set.
+
+    With png, output is a directory and each page becomes sheet_NNNNN.png.
+    Returns the number of pages written.
+    """
+    page = PAGES[layout]()
+    pages = 0
+    try:
+        if png:
+            os.makedirs(output, exist_ok=True)
+            for pages, chunk in enumerate(_pages(records, page.per_page), 1):
+                page.fill(chunk, f"{title} - sheet {pages}")
+                page.fig.savefig(os.path.join(output, f"sheet_{pages:05d}.png"), dpi=dpi)
+        else:
+            from matplotlib.backends.backend_pdf import PdfPages
+            with PdfPages(output) as pdf:
+                for pages, chunk in enumerate(_pages(records, page.per_page), 1):
+                    page.fill(chunk, f"{title} - page {pages}")
+                    pdf.savefig(page.fig)
+    finally:
+        page.fig.clear()  # Release the page's artists now rather than at interpreter exit
+    return pages
+
+
+def main(argv=None):
+    """Command-line entry point for report generation."""
+    parser = argparse.ArgumentParser(description="Write many gauges to a PDF or PNG contact sheets.")
+    parser.add_argument("input", help="CSV (label,percentage) or JSONL file of records")
+    parser.add_argument("output", help="PDF file, or directory with --png")
+    parser.add_argument("--layout", choices=LAYOUTS, default="rows")
+    parser.add_argument("--png", action="store_true", help="Write PNG contact sheets instead of a PDF")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--title", default="Percentage report")
+    parser.add_argument("--rejects", help="CSV file for rows that fail validation")
+    args = parser.parse_args(argv)
+
+    pages = write_report(iter_records(args.input, args.rejects), args.output, args.layout,
+                         png=args.png, dpi=args.dpi, title=args.title)
+    print(f"Wrote {pages} pages to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""Local HTTP service that returns gauge images.
+
+    GET /gauge?label=CPU&pct=42.5&style=dial&format=png
+
+Styles "bar" and "dial" are the sliderV3 figures, rendered by worker
+processes that each hold warm Agg figures from gauges.batch_render.
+"arc", "pie" and "donut" are the slider4, slider3 and sliderV4-1 gauges,
+rendered by gauges.raster as PNG or written directly as SVG; those
+images carry no label.
+
+Percentages are quantized to 0.1. Responses are cached in memory (LRU,
+bounded by bytes) and on disk, content-addressed by SHA-256. The key is
+style, format, quantized percentage and label hash, so an identical gauge
+is rendered only once. The server only binds to loopback addresses.
+
+Usage:
+    python -m gauges.server --port 8765 --cache-dir /tmp/gauge-cache
+"""
+import argparse
+import hashlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+from gauges.colors import get_color
+
+MPL_STYLES = ("bar", "dial")
+RASTER_STYLES = ("arc", "pie", "donut")
+STYLES = MPL_STYLES + RASTER_STYLES
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+LOOPBACK = ("127.0.0.1", "::1", "localhost")
+
+
+def quantize(percentage):
+    """Clamp to 0-100 and round to 0.1."""
+    return round(min(100.0, max(0.0, percentage)), 1)
+
+
+def cache_key(style, fmt, percentage, label):
+    """Cache key for a request; labels only matter for the matplotlib styles."""
+    label_hash = hashlib.sha256(label.encode()).hexdigest()[:16] if style in MPL_STYLES else "-"
+    return f"{style}:{fmt}:{percentage:.1f}:{label_hash}"
+
+
+class MemoryCache:
+    """Thread-safe LRU of response bodies, bounded by total bytes."""
+
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            body = self._items.get(key)
+            if body is not None:
+                self._items.move_to_end(key)
+            return body
+
+    def put(self, key, body):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class DiskCache:
+    """Content-addressed blob store with a key -> digest index.
+
+    objects/ab/cdef... holds each distinct body once, named by its SHA-256;
+    keys/<sha256 of key> holds the digest of the body for that key.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "keys"), exist_ok=True)
+
+    def _key_path(self, key):
+        return os.path.join(self.root, "keys", hashlib.sha256(key.encode()).hexdigest())
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def get(self, key):
+        try:
+            with open(self._key_path(key)) as f:
+                digest = f.read().strip()
+            with open(self._object_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _atomic_write(path, body)
+        _atomic_write(self._key_path(key), digest.encode())
+
+
+def _atomic_write(path, data):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+_renderers = None  # Per-process {style: renderer}, created by _init_renderers
+
+
+def _init_renderers():
+    """Create the warm figures of one worker process, on the Agg backend."""
+    global _renderers
+    import matplotlib
+    matplotlib.use("Agg")
+    from gauges.batch_render import RENDERERS
+    _renderers = {style: RENDERERS[style]() for style in MPL_STYLES}
+
+
+def _render_figure(style, label, percentage, fmt):
+    """Render one matplotlib gauge in a worker process."""
+    renderer = _renderers[style]
+    renderer.update(label, percentage)
+    out = io.BytesIO()
+    renderer.fig.savefig(out, format=fmt, dpi=renderer.dpi)
+    return out.getvalue()
+
+
+class RendererPool:
+    """Worker processes holding warm Agg figures, one of each style per process.
+
+    matplotlib is not thread-safe (figures share the font cache and
+    FT2Font objects), so request threads never touch a figure. Each
+    render runs in one of size processes, which also lets them run in
+    parallel. Workers are spawned rather than forked from the threaded
+    server.
+    """
+
+    def __init__(self, size):
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(max_workers=size, mp_context=context,
+                                             initializer=_init_renderers)
+
+    def render(self, style, label, percentage, fmt):
+        return self._executor.submit(_render_figure, style, label, percentage, fmt).result()
+
+    def close(self):
+        self._executor.shutdown(cancel_futures=True)
+
+
+def _arc_path(cx, cy, r, start, sweep):
+    """SVG path data for a circular arc; angles in degrees, counter-clockwise from east."""
+    x0, y0 = cx + r * math.cos(math.radians(start)), cy - r * math.sin(math.radians(start))
+    end = start + sweep
+    x1, y1 = cx + r * math.cos(math.radians(end)), cy - r * math.sin(math.radians(end))
+    large = 1 if abs(sweep) > 180 else 0
+    clockwise = 0 if sweep > 0 else 1
+    return f"M {x0:.2f} {y0:.2f} A {r} {r} 0 {large} {clockwise} {x1:.2f} {y1:.2f}"
+
+
+def render_svg(style, percentage):
+    """SVG for the arc, pie and donut styles, matching the script geometry."""
+    color = get_color(percentage)
+    parts = ['<svg xmlns="http://www.w3.org/2000/svg" width="220" height="220" viewBox="0 0 220 220">',
+             '<rect width="220" height="220" fill="white"/>']
+    c = 110
+    if style == "pie":
+        parts.append(f'<circle cx="{c}" cy="{c}" r="100" fill="grey"/>')
+        if percentage >= 100:
+            parts.append(f'<circle cx="{c}" cy="{c}" r="100" fill="{color}"/>')
+        elif percentage > 0:
+            arc = _arc_path(c, c, 100, 90, 360 * percentage / 100)
+            parts.append(f'<path d="M {c} {c} L{arc[1:]} Z" fill="{color}"/>')
+    elif style == "donut":
+        parts.append(f'<circle cx="{c}" cy="{c}" r="80" fill="none" stroke="rgb(200,200,200)" stroke-width="40"/>')
+        if percentage >= 100:
+            parts.append(f'<circle cx="{c}" cy="{c}" r="80" fill="none" stroke="{color}" stroke-width="40"/>')
+        elif percentage > 0:
+            parts.append(f'<path d="{_arc_path(c, c, 80, 90, -360 * percentage / 100)}" '
+                         f'fill="none" stroke="{color}" stroke-width="40"/>')
+    else:
+        parts.append(f'<path d="{_arc_path(c, c, 100, 135, 270)}" fill="none" stroke="grey" stroke-width="10"/>')
+        if percentage > 0:
+            parts.append(f'<path d="{_arc_path(c, c, 100, 135, 270 * percentage / 100)}" '
+                         f'fill="none" stroke="{color}" stroke-width="10"/>')
+        angle = math.radians(135 + 270 * percentage / 100)
+        x, y = c + 90 * math.cos(angle), c - 90 * math.sin(angle)
+        parts.append(f'<line x1="{c}" y1="{c}" x2="{x:.2f}" y2="{y:.2f}" stroke="black" stroke-width="2"/>')
+        parts.append(f'<circle cx="{c}" cy="{c}" r="5" fill="black"/>')
+    parts.append("</svg>")
+    return "\n".join(parts).encode()
+
+
+class GaugeService:
+    """Renders and caches gauge images."""
+
+    def __init__(self, cache_dir=None, pool_size=4, memory_bytes=64 * 2 ** 20, raster_size=220):
+        self.memory = MemoryCache(memory_bytes)
+        self.disk = DiskCache(cache_dir) if cache_dir else None
+        self.pool_size = pool_size
+        self.raster_size = raster_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.stats = {"requests": 0, "memory_hits": 0, "disk_hits": 0, "renders": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    @property
+    def pool(self):
+        """The warm renderer pool, created on first use of a matplotlib style."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = RendererPool(self.pool_size)
+            return self._pool
+
+    def close(self):
+        """Stop the renderer processes, if any were started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+    def render(self, style, label, percentage, fmt):
+        """Render an image without consulting the caches."""
+        if style in MPL_STYLES:
+            return self.pool.render(style, label, percentage, fmt)
+        if fmt == "svg":
+            return render_svg(style, percentage)
+        from gauges import raster
+        return raster.to_png_bytes(raster.render(style, percentage, self.raster_size))
+
+    def get(self, style, label, percentage, fmt):
+        """Return image bytes for a request, rendering only on a cache miss."""
+        self._count("requests")
+        percentage = quantize(percentage)
+        key = cache_key(style, fmt, percentage, label)
+        body = self.memory.get(key)
+        if body is not None:
+            self._count("memory_hits")
+            return body
+        if self.disk is not None:
+            body = self.disk.get(key)
+            if body is not None:
+                self._count("disk_hits")
+                self.memory.put(key, body)
+                return body
+        body = self.render(style, label, percentage, fmt)
+        self._count("renders")
+        self.memory.put(key, body)
+        if self.disk is not None:
+            self.disk.put(key, body)
+        return body
+
+
+class GaugeRequestHandler(BaseHTTPRequestHandler):
+    """Serves /gauge, /stats and /healthz."""
+
+    service = None  # Set by make_server
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/healthz":
+            return self._send(200, "text/plain", b"ok")
+        if url.path == "/stats":
+            return self._send(200, "application/json", json.dumps(self.service.stats).encode())
+        if url.path != "/gauge":
+            return self._send(404, "text/plain", b"not found")
+
+        query = parse_qs(url.query)
+        label = query.get("label", [""])[0]
+        style = query.get("style", ["dial"])[0]
+        fmt = query.get("format", ["png"])[0]
+        try:
+            percentage = float(query["pct"][0])
+        except (KeyError, ValueError):
+            return self._send(400, "text/plain", b"pct must be a number between 0 and 100")
+        if not 0 <= percentage <= 100:
+            return self._send(400, "text/plain", b"pct must be a number between 0 and 100")
+        if style not in STYLES or fmt not in FORMATS:
+            return self._send(400, "text/plain", f"style must be one of {STYLES}, format png or svg".encode())
+        label = "\n".join(label.replace("\\n", "\n").splitlines()[:3])
+
+        body = self.service.get(style, label, percentage, fmt)
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, FORMATS[fmt], b"", etag)
+        self._send(200, FORMATS[fmt], body, etag)
+
+    def _send(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=86400")
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Thousands of requests per minute would flood stderr
+
+
+def make_server(host="127.0.0.1", port=8765, service=None):
+    """Create (but do not start) a ThreadingHTTPServer on a loopback address."""
+    if host not in LOOPBACK:
+        raise ValueError(f"Refusing to bind to non-loopback address {host!r}")
+    handler = type("Handler", (GaugeRequestHandler,), {"service": service or GaugeService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    """Run the gauge service until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve gauge images over HTTP on localhost.")
+    parser.add_argument("--host", default="127.0.0.1", choices=LOOPBACK)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-dir", help="Directory for the on-disk content-addressed cache")
+    parser.add_argument("--pool-size", type=int, default=4, help="Render processes for the matplotlib styles")
+    parser.add_argument("--memory-mb", type=int, default=64, help="In-memory cache size")
+    args = parser.parse_args(argv)
+
+    service = GaugeService(args.cache_dir, args.pool_size, args.memory_mb * 2 ** 20)
+    server = make_server(args.host, args.port, service)
+    print(f"Serving gauges on http://{args.host}:{args.port}/gauge?label=CPU&pct=42&style=dial")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Bounded LRU cache of rendered text surfaces for the pygame gauges."""
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache of font.render results keyed by (text, font, color, antialias).
+
+    Fonts are used as part of the key by identity, so keep one Font object
+    per size/face instead of creating new ones per frame.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Return a rendered Surface for text, rasterizing it only on a miss."""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        """Return hit/miss counters and current size as a dict."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._surfaces),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Drop all cached surfaces and reset the counters."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
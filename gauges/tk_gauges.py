@@ -0,0 +1,125 @@
+"""Retained-mode Tk canvas gauges.
+
+Canvas items are created once; set() only changes the arc extent, the
+color and the needle coordinates through itemconfig and coords, so
+updating a gauge never deletes or recreates items.
+"""
+import math
+import tkinter as tk
+
+from gauges.colors import get_color
+
+
+class PieChart:
+    """Pie chart from slider3.py: grey disc with a colored slice from the top."""
+
+    START_ANGLE = 90  # Start at top
+
+    def __init__(self, canvas, center_x=150, center_y=150, radius=100, tags=()):
+        self.canvas = canvas
+        self.percentage = None
+        box = (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+        self.background = canvas.create_oval(*box, fill="grey", tags=tags)
+        self.slice = canvas.create_arc(*box, start=self.START_ANGLE, extent=0, tags=tags)
+        self.items = (self.background, self.slice)
+
+    def set(self, percentage):
+        """Update the slice to show percentage; no-op if it is unchanged."""
+        if percentage == self.percentage:
+            return
+        self.percentage = percentage
+        color = get_color(percentage)
+        self.canvas.itemconfig(self.slice, extent=(percentage / 100) * 360, fill=color, outline=color)
+
+    def move_to(self, center_x, center_y):
+        """Move every item so the chart is centered on (center_x, center_y)."""
+        x0, y0, x1, y1 = self.canvas.coords(self.background)
+        dx, dy = center_x - (x0 + x1) / 2, center_y - (y0 + y1) / 2
+        for item in self.items:
+            self.canvas.move(item, dx, dy)
+
+    def destroy(self):
+        """Delete the canvas items."""
+        for item in self.items:
+            self.canvas.delete(item)
+
+
+class ArcGauge:
+    """270 degree gauge from slider4.py: grey track, colored arc, needle and hub."""
+
+    START_ANGLE = 135  # Start at 135 degrees (left side)
+    EXTENT = 270       # Cover 270 degrees to 45 degrees
+
+    def __init__(self, canvas, center_x=150, center_y=150, radius=100, tags=()):
+        self.canvas = canvas
+        self.center_x = center_x
+        self.center_y = center_y
+        self.radius = radius
+        self.percentage = None
+        box = (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+        self.track = canvas.create_arc(*box, start=self.START_ANGLE, extent=self.EXTENT,
+                                       style=tk.ARC, outline="grey", width=10, tags=tags)
+        self.arc = canvas.create_arc(*box, start=self.START_ANGLE, extent=0,
+                                     style=tk.ARC, width=10, tags=tags)
+        self.needle = canvas.create_line(center_x, center_y, center_x, center_y,
+                                         fill="black", width=2, tags=tags)
+        self.hub = canvas.create_oval(center_x - 5, center_y - 5, center_x + 5, center_y + 5,
+                                      fill="black", tags=tags)
+        self.items = (self.track, self.arc, self.needle, self.hub)
+
+    def set(self, percentage):
+        """Update the arc and needle to show percentage; no-op if it is unchanged."""
+        if percentage == self.percentage:
+            return
+        self.percentage = percentage
+        percentage_extent = (percentage / 100) * self.EXTENT
+        self.canvas.itemconfig(self.arc, extent=percentage_extent, outline=get_color(percentage))
+        angle = math.radians(self.START_ANGLE + percentage_extent)
+        needle_length = self.radius - 10
+        end_x = self.center_x + needle_length * math.cos(angle)
+        end_y = self.center_y - needle_length * math.sin(angle)
+        self.canvas.coords(self.needle, self.center_x, self.center_y, end_x, end_y)
+
+    def move_to(self, center_x, center_y):
+        """Move every item so the gauge is centered on (center_x, center_y)."""
+        dx, dy = center_x - self.center_x, center_y - self.center_y
+        for item in self.items:
+            self.canvas.move(item, dx, dy)
+        self.center_x, self.center_y = center_x, center_y
+
+    def destroy(self):
+        """Delete the canvas items."""
+        for item in self.items:
+            self.canvas.delete(item)
+
+
+class Sparkline:
+    """Line of a gauge's recent history inside a fixed box on the canvas."""
+
+    def __init__(self, canvas, left, top, width, height, tags=()):
+        self.canvas = canvas
+        self.box = (left, top, width, height)
+        self.version = None
+        self.frame = canvas.create_rectangle(left, top, left + width, top + height,
+                                             outline="#dddddd", tags=tags)
+        self.line = canvas.create_line(left, top, left, top, fill="#555555",
+                                       state=tk.HIDDEN, tags=tags)
+        self.items = (self.frame, self.line)
+
+    def update(self, history):
+        """Redraw from a gauges.history.History; no-op if it has not changed."""
+        if history.version == self.version:
+            return
+        from gauges.history import sparkline_points
+        self.version = history.version
+        points = sparkline_points(history, *self.box)
+        if not points:
+            self.canvas.itemconfig(self.line, state=tk.HIDDEN)
+            return
+        self.canvas.coords(self.line, *[c for point in points for c in point])
+        self.canvas.itemconfig(self.line, state=tk.NORMAL)
+
+    def destroy(self):
+        """Delete the canvas items."""
+        for item in self.items:
+            self.canvas.delete(item)
@@ -0,0 +1,47 @@
+"""Pool of per-color ttk progress bar styles.
+
+Calling style.configure() on a shared style recolors every bar using it
+and makes Tk refresh the whole theme. ProgressStylePool instead creates
+one child style per quantized color bucket ("P42.Custom.Horizontal.
+TProgressbar" inherits thickness and the rest from its parent). A bar
+changes color by switching to another style name. Each style is
+configured the first time its bucket is used. After that, an update is a
+dict lookup plus, only if the bucket changed, one widget configure.
+"""
+from gauges.colors import get_color
+
+PARENT = "Custom.Horizontal.TProgressbar"
+STEP = 1.0  # Percentage points per color bucket
+
+
+class ProgressStylePool:
+    """Lazily memoized ttk styles, one per color bucket of STEP percent."""
+
+    def __init__(self, style, parent=PARENT, step=STEP):
+        self.style = style
+        self.parent = parent
+        self.step = step
+        self._names = {}    # bucket -> style name
+        self._current = {}  # widget path -> style name it currently uses
+
+    def name(self, percentage):
+        """Style name for a percentage, configuring the style on first use."""
+        bucket = int(percentage / self.step + 0.5)
+        name = self._names.get(bucket)
+        if name is None:
+            name = f"P{bucket}.{self.parent}"
+            color = get_color(bucket * self.step)
+            self.style.configure(name, troughcolor=color, background=color)
+            self._names[bucket] = name
+        return name
+
+    def apply(self, bar, percentage):
+        """Give bar the style for percentage; skips the widget call if it already has it."""
+        name = self.name(percentage)
+        key = str(bar)
+        if self._current.get(key) != name:
+            bar.configure(style=name)
+            self._current[key] = name
+
+    def __len__(self):
+        return len(self._names)
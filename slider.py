@@ -1,26 +1,19 @@
 import tkinter as tk
 from tkinter import messagebox
+from gauges.colors import get_color
+from gauges.feed import start_feed_from_argv
 
-def interpolate_color(value, min_val, max_val, color1, color2):
-    """Interpolate between two colors based on a value."""
-    ratio = (value - min_val) / (max_val - min_val)
-    r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-    g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-    b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-    return f'#{r:02x}{g:02x}{b:02x}'
+def show_percentage(label_text, percentage):
+    """Show a label and percentage on the slider."""
+    # Update label
+    display_label.config(text=label_text)
 
-def get_color(percentage):
-    """Determine the color based on percentage (0% red, 50% orange, 100% green)."""
-    red = (255, 0, 0)      # RGB for red
-    orange = (255, 165, 0)  # RGB for orange
-    green = (0, 255, 0)     # RGB for green
-    
-    if percentage <= 50:
-        # Interpolate between red and orange
-        return interpolate_color(percentage, 0, 50, red, orange)
-    else:
-        # Interpolate between orange and green
-        return interpolate_color(percentage, 50, 100, orange, green)
+    # Update slider
+    slider.set(percentage)
+
+    # Update slider color
+    color = get_color(percentage)
+    slider.config(troughcolor=color, background=color)
 
 def submit():
     """Handle the submit button action."""
@@ -31,16 +24,8 @@ def submit():
             messagebox.showerror("Invalid Input", "Percentage must be between 0 and 100.")
             return
         
-        # Update label
-        display_label.config(text=label_text)
-        
-        # Update slider
-        slider.set(percentage)
-        
-        # Update slider color
-        color = get_color(percentage)
-        slider.config(troughcolor=color, background=color)
-        
+        show_percentage(label_text, percentage)
+
     except ValueError:
         messagebox.showerror("Invalid Input", "Please enter a valid percentage (e.g., 75.5).")
 
@@ -73,5 +58,8 @@ display_label.pack(pady=20)
 slider = tk.Scale(root, from_=0, to=100, orient=tk.HORIZONTAL, length=300, showvalue=True)
 slider.pack(pady=20)
 
+# Optional streaming feed, e.g. python slider.py --feed tcp:9000
+start_feed_from_argv(root, show_percentage)
+
 # Start the main loop
 root.mainloop()
\ No newline at end of file
@@ -1,23 +1,18 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
+from gauges.ttk_styles import ProgressStylePool
+from gauges.feed import start_feed_from_argv
 
-def interpolate_color(value, min_val, max_val, color1, color2):
-    """Interpolate between two colors based on a value."""
-    ratio = (value - min_val) / (max_val - min_val)
-    r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-    g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-    b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-    return f'#{r:02x}{g:02x}{b:02x}'
+def show_percentage(label_text, percentage):
+    """Show a label and percentage on the progress bar."""
+    # Update label
+    display_label.config(text=label_text)
 
-def get_color(percentage):
-    """Determine the color based on percentage (0% red, 50% orange, 100% green)."""
-    red = (255, 0, 0)
-    orange = (255, 165, 0)
-    green = (0, 255, 0)
-    if percentage <= 50:
-        return interpolate_color(percentage, 0, 50, red, orange)
-    else:
-        return interpolate_color(percentage, 50, 100, orange, green)
+    # Update progress bar
+    progress_bar["value"] = percentage
+
+    # Update progress bar color by switching to the style for its color bucket
+    styles.apply(progress_bar, percentage)
 
 def submit():
     """Handle the submit button action."""
@@ -28,16 +23,8 @@ def submit():
             messagebox.showerror("Invalid Input", "Percentage must be between 0 and 100.")
             return
         
-        # Update label
-        display_label.config(text=label_text)
-        
-        # Update progress bar
-        progress_bar["value"] = percentage
-        
-        # Update progress bar color
-        color = get_color(percentage)
-        style.configure("Custom.Horizontal.TProgressbar", troughcolor=color, background=color)
-        
+        show_percentage(label_text, percentage)
+
     except ValueError:
         messagebox.showerror("Invalid Input", "Please enter a valid percentage (e.g., 75.5).")
 
@@ -67,8 +54,12 @@ display_label.pack(pady=20)
 # Progress bar
 style = ttk.Style()
 style.configure("Custom.Horizontal.TProgressbar", thickness=20)
+styles = ProgressStylePool(style, "Custom.Horizontal.TProgressbar")
 progress_bar = ttk.Progressbar(root, orient="horizontal", length=300, mode="determinate", style="Custom.Horizontal.TProgressbar")
 progress_bar.pack(pady=20)
 
+# Optional streaming feed, e.g. python slider2.py --feed tcp:9000
+start_feed_from_argv(root, show_percentage)
+
 # Start the main loop
 root.mainloop()
\ No newline at end of file
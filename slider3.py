@@ -1,40 +1,33 @@
+import sys
 import tkinter as tk
 from tkinter import messagebox
-import math
+from gauges.tk_gauges import PieChart
+from gauges.feed import start_feed_from_argv
+from gauges.render_pool import PooledGauge, RenderPool, workers_from_argv
 
-def interpolate_color(value, min_val, max_val, color1, color2):
-    """Interpolate between two colors based on a value."""
-    ratio = (value - min_val) / (max_val - min_val)
-    r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-    g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-    b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-    return f'#{r:02x}{g:02x}{b:02x}'
-
-def get_color(percentage):
-    """Determine the color based on percentage (0% red, 50% orange, 100% green)."""
-    red = (255, 0, 0)
-    orange = (255, 165, 0)
-    green = (0, 255, 0)
-    if percentage <= 50:
-        return interpolate_color(percentage, 0, 50, red, orange)
-    else:
-        return interpolate_color(percentage, 50, 100, orange, green)
+pie_chart = None  # Created on the first draw, then updated in place
 
 def draw_pie_chart(percentage):
     """Draw a pie chart on the canvas based on the percentage."""
-    canvas.delete("all")  # Clear previous drawing
-    center_x, center_y = 150, 150
-    radius = 100
-    start_angle = 90  # Start at top
-    extent = (percentage / 100) * 360  # Angle for percentage
-    
-    # Draw background circle (unfilled portion)
-    canvas.create_oval(center_x - radius, center_y - radius, center_x + radius, center_y + radius, fill="grey")
-    
-    # Draw filled portion
-    color = get_color(percentage)
-    canvas.create_arc(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
-                      start=start_angle, extent=extent, fill=color, outline=color)
+    global pie_chart
+    if pie_chart is None:
+        workers = workers_from_argv()
+        if workers:
+            # Render images in background threads so input stays responsive
+            from gauges.atlas import size_for_radius
+            size = size_for_radius("pie", 100)
+            pie_chart = PooledGauge(canvas, RenderPool(root, workers), "pie", size)
+        else:
+            pie_chart = PieChart(canvas, center_x=150, center_y=150, radius=100)
+    pie_chart.set(percentage)
+
+def show_percentage(label_text, percentage):
+    """Show a label and percentage on the pie chart."""
+    # Update label
+    display_label.config(text=label_text)
+
+    # Update pie chart
+    draw_pie_chart(percentage)
 
 def submit():
     """Handle the submit button action."""
@@ -45,12 +38,8 @@ def submit():
             messagebox.showerror("Invalid Input", "Percentage must be between 0 and 100.")
             return
         
-        # Update label
-        display_label.config(text=label_text)
-        
-        # Update pie chart
-        draw_pie_chart(percentage)
-        
+        show_percentage(label_text, percentage)
+
     except ValueError:
         messagebox.showerror("Invalid Input", "Please enter a valid percentage (e.g., 75.5).")
 
@@ -81,5 +70,15 @@ display_label.pack(pady=20)
 canvas = tk.Canvas(root, width=300, height=300)
 canvas.pack(pady=20)
 
+# Optional pre-rendered frames from the shared atlas, e.g. python slider3.py --atlas
+# The atlas is opened (or built) in the background while the gauge draws live
+if "--atlas" in sys.argv and not workers_from_argv():
+    from gauges.atlas import BackgroundAtlasGauge, size_for_radius
+    pie_chart = BackgroundAtlasGauge(canvas, "pie", size_for_radius("pie", 100),
+                                     lambda: PieChart(canvas, center_x=150, center_y=150, radius=100))
+
+# Optional streaming feed, e.g. python slider3.py --feed tcp:9000
+start_feed_from_argv(root, show_percentage)
+
 # Start the main loop
 root.mainloop()
\ No newline at end of file
@@ -1,52 +1,46 @@
+import sys
 import tkinter as tk
 from tkinter import messagebox
-import math
-
-def interpolate_color(value, min_val, max_val, color1, color2):
-    """Interpolate between two colors based on a value."""
-    ratio = (value - min_val) / (max_val - min_val)
-    r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-    g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-    b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-    return f'#{r:02x}{g:02x}{b:02x}'
-
-def get_color(percentage):
-    """Determine the color based on percentage (0% red, 50% orange, 100% green)."""
-    red = (255, 0, 0)
-    orange = (255, 165, 0)
-    green = (0, 255, 0)
-    if percentage <= 50:
-        return interpolate_color(percentage, 0, 50, red, orange)
-    else:
-        return interpolate_color(percentage, 50, 100, orange, green)
+from gauges.tk_gauges import ArcGauge, Sparkline
+from gauges.feed import start_feed_from_argv
+from gauges.render_pool import PooledGauge, RenderPool, workers_from_argv
+
+gauge = None  # Created on the first draw, then updated in place
+history = None    # gauges.history.History of every value shown
+sparkline = None  # History line under the gauge
 
 def draw_gauge(percentage):
     """Draw a circular gauge on the canvas based on the percentage."""
-    canvas.delete("all")  # Clear previous drawing
-    center_x, center_y = 150, 150
-    radius = 100
-    start_angle = 135  # Start at 135 degrees (left side)
-    extent = 270       # Cover 270 degrees to 45 degrees
-    
-    # Draw background arc
-    canvas.create_arc(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
-                      start=start_angle, extent=extent, style=tk.ARC, outline="grey", width=10)
-    
-    # Draw filled arc for percentage
-    percentage_extent = (percentage / 100) * extent
-    color = get_color(percentage)
-    canvas.create_arc(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
-                      start=start_angle, extent=percentage_extent, style=tk.ARC, outline=color, width=10)
-    
-    # Draw needle
-    angle = math.radians(start_angle + percentage_extent)
-    needle_length = radius - 10
-    end_x = center_x + needle_length * math.cos(angle)
-    end_y = center_y - needle_length * math.sin(angle)
-    canvas.create_line(center_x, center_y, end_x, end_y, fill="black", width=2)
-    
-    # Draw center dot
-    canvas.create_oval(center_x - 5, center_y - 5, center_x + 5, center_y + 5, fill="black")
+    global gauge
+    if gauge is None:
+        workers = workers_from_argv()
+        if workers:
+            # Render images in background threads so input stays responsive
+            from gauges.atlas import size_for_radius
+            size = size_for_radius("arc", 100)
+            gauge = PooledGauge(canvas, RenderPool(root, workers), "arc", size)
+        else:
+            gauge = ArcGauge(canvas, center_x=150, center_y=150, radius=100)
+    gauge.set(percentage)
+
+def draw_history(percentage):
+    """Record the percentage and redraw the sparkline under the gauge."""
+    global history, sparkline
+    if history is None:
+        from gauges.history import History
+        history = History()
+        sparkline = Sparkline(canvas, 20, 264, 260, 32)  # Below the arc track, which reaches y=255
+    history.append(percentage)
+    sparkline.update(history)
+
+def show_percentage(label_text, percentage):
+    """Show a label and percentage on the gauge."""
+    # Update label
+    display_label.config(text=label_text)
+
+    # Update gauge
+    draw_gauge(percentage)
+    draw_history(percentage)
 
 def submit():
     """Handle the submit button action."""
@@ -57,12 +51,8 @@ def submit():
             messagebox.showerror("Invalid Input", "Percentage must be between 0 and 100.")
             return
         
-        # Update label
-        display_label.config(text=label_text)
-        
-        # Update gauge
-        draw_gauge(percentage)
-        
+        show_percentage(label_text, percentage)
+
     except ValueError:
         messagebox.showerror("Invalid Input", "Please enter a valid percentage (e.g., 75.5).")
 
@@ -93,5 +83,15 @@ display_label.pack(pady=20)
 canvas = tk.Canvas(root, width=300, height=300)
 canvas.pack(pady=20)
 
+# Optional pre-rendered frames from the shared atlas, e.g. python slider4.py --atlas
+# The atlas is opened (or built) in the background while the gauge draws live
+if "--atlas" in sys.argv and not workers_from_argv():
+    from gauges.atlas import BackgroundAtlasGauge, size_for_radius
+    gauge = BackgroundAtlasGauge(canvas, "arc", size_for_radius("arc", 100),
+                                 lambda: ArcGauge(canvas, center_x=150, center_y=150, radius=100))
+
+# Optional streaming feed, e.g. python slider4.py --feed tcp:9000
+start_feed_from_argv(root, show_percentage)
+
 # Start the main loop
 root.mainloop()
\ No newline at end of file
@@ -1,23 +1,9 @@
+import base64
+import sys
 import tkinter as tk
 from tkinter import messagebox
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-import numpy as np
-
-def get_color(percentage):
-    """Calculate color based on percentage (0% red, 50% orange, 100% green)."""
-    if percentage <= 50:
-        # Interpolate from red (0%) to orange (50%)
-        r = 1.0
-        g = (percentage / 50) * 0.647  # Orange has RGB (1, 0.647, 0)
-        b = 0.0
-    else:
-        # Interpolate from orange (50%) to green (100%)
-        r = ((100 - percentage) / 50) * 1.0  # Orange to green, reduce red
-        g = 1.0  # Green component increases
-        b = 0.0
-    return (r, g, b)
+from gauges.colors import get_color_float as get_color
+from gauges.render_pool import RenderPool, render_figure_png
 
 def create_visualization():
     """Create the visualization based on user input."""
@@ -32,13 +18,35 @@ def create_visualization():
         return
 
     # Close the input window
+    if preview_pool is not None:
+        preview_pool.shutdown()
     root.destroy()
 
+    visualize_percentage(label, percentage)
+
+def visualize_percentage(label, percentage):
+    """Create a figure with the label as title above a color-coded bar."""
+    # Plotting libraries are imported on first use to keep startup fast
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Set up Seaborn style
     sns.set_style("whitegrid")
 
     # Create a figure
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig = plt.figure(figsize=(10, 4))
+    draw_percentage(fig, label, percentage)
+
+    # Show the plot
+    plt.tight_layout()
+    plt.show()
+
+def draw_percentage(fig, label, percentage):
+    """Draw the label as title above a color-coded bar onto fig."""
+    from matplotlib.colors import LinearSegmentedColormap
+    import numpy as np
+
+    ax = fig.subplots()
 
     # Create custom colormap for the slider
     colors = [(1, 0, 0), (1, 0.647, 0), (0, 1, 0)]  # Red, Orange, Green
@@ -54,9 +62,27 @@ def create_visualization():
     # Add the label as title (split into lines if necessary)
     ax.set_title(label, pad=20, wrap=True)
 
-    # Show the plot
-    plt.tight_layout()
-    plt.show()
+def update_preview(event=None):
+    """Re-render the preview off the main thread from the current input."""
+    label = label_text.get("1.0", tk.END).strip()
+    try:
+        percentage = float(percentage_entry.get())
+    except ValueError:
+        return
+    if 0 <= percentage <= 100:
+        # A newer keystroke cancels or discards this render
+        preview_pool.submit("preview", show_preview, render_figure_png, draw_percentage,
+                            PREVIEW_SIZE, PREVIEW_DPI, label, percentage)
+
+def show_preview(png):
+    """Show a rendered preview PNG under the inputs."""
+    preview_label.image = tk.PhotoImage(master=root, data=base64.b64encode(png), format="png")
+    preview_label.config(image=preview_label.image)
+
+preview_pool = None   # RenderPool when started with --preview
+preview_label = None  # Label showing the preview image
+PREVIEW_SIZE = (5, 2)  # Inches; fits the launcher window at PREVIEW_DPI
+PREVIEW_DPI = 75
 
 # Create the Tkinter GUI
 root = tk.Tk()
@@ -76,5 +102,17 @@ percentage_entry.pack(pady=5)
 # Submit button
 tk.Button(root, text="Create Visualization", command=create_visualization).pack(pady=20)
 
+# Optional live preview rendered in a worker thread, e.g. python sliderV2-1.py --preview
+if "--preview" in sys.argv:
+    import seaborn as sns
+    # Style is global matplotlib state; set it here, not from the render thread
+    sns.set_style("whitegrid")
+    root.geometry("400x480")
+    preview_pool = RenderPool(root, workers=1)  # matplotlib is not thread-safe, one worker
+    preview_label = tk.Label(root)
+    preview_label.pack(pady=5)
+    label_text.bind("<KeyRelease>", update_preview)
+    percentage_entry.bind("<KeyRelease>", update_preview)
+
 # Start the Tkinter main loop
 root.mainloop()
\ No newline at end of file
@@ -1,23 +1,9 @@
+import base64
+import sys
 import tkinter as tk
 from tkinter import messagebox
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-import numpy as np
-
-def get_color(percentage):
-    """Calculate color based on percentage (0% red, 50% orange, 100% green)."""
-    if percentage <= 50:
-        # Interpolate from red (0%) to orange (50%)
-        r = 1.0
-        g = (percentage / 50) * 0.647  # Orange has RGB (1, 0.647, 0)
-        b = 0.0
-    else:
-        # Interpolate from orange (50%) to green (100%)
-        r = ((100 - percentage) / 50) * 1.0  # Orange to green, reduce red
-        g = 1.0  # Green component increases
-        b = 0.0
-    return (r, g, b)
+from gauges.colors import get_color_float as get_color
+from gauges.render_pool import RenderPool, render_figure_png
 
 def create_visualization():
     """Create a compact visualization with label on the left and slider on the right."""
@@ -32,13 +18,35 @@ def create_visualization():
         return
 
     # Close the input window
+    if preview_pool is not None:
+        preview_pool.shutdown()
     root.destroy()
 
+    visualize_percentage(label, percentage)
+
+def visualize_percentage(label, percentage):
+    """Create a compact figure with the label on the left and the bar on the right."""
+    # Plotting libraries are imported on first use to keep startup fast
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Set up Seaborn style
     sns.set_style("whitegrid")
 
     # Create a compact figure
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8, 2), gridspec_kw={'width_ratios': [1, 2]})
+    fig = plt.figure(figsize=(8, 2))
+    draw_percentage(fig, label, percentage)
+
+    # Adjust layout to be compact
+    plt.tight_layout()
+    plt.show()
+
+def draw_percentage(fig, label, percentage):
+    """Draw the label on the left and the bar on the right onto fig."""
+    from matplotlib.colors import LinearSegmentedColormap
+    import numpy as np
+
+    ax1, ax2 = fig.subplots(1, 2, gridspec_kw={'width_ratios': [1, 2]})
 
     # Display label on the left (ax1)
     ax1.axis('off')  # Hide axes for label
@@ -53,9 +61,27 @@ def create_visualization():
     ax2.set_xlabel("Percentage (%)", fontsize=8)
     ax2.tick_params(axis='x', labelsize=8)
 
-    # Adjust layout to be compact
-    plt.tight_layout()
-    plt.show()
+def update_preview(event=None):
+    """Re-render the preview off the main thread from the current input."""
+    label = label_text.get("1.0", tk.END).strip()
+    try:
+        percentage = float(percentage_entry.get())
+    except ValueError:
+        return
+    if 0 <= percentage <= 100:
+        # A newer keystroke cancels or discards this render
+        preview_pool.submit("preview", show_preview, render_figure_png, draw_percentage,
+                            PREVIEW_SIZE, PREVIEW_DPI, label, percentage)
+
+def show_preview(png):
+    """Show a rendered preview PNG under the inputs."""
+    preview_label.image = tk.PhotoImage(master=root, data=base64.b64encode(png), format="png")
+    preview_label.config(image=preview_label.image)
+
+preview_pool = None   # RenderPool when started with --preview
+preview_label = None  # Label showing the preview image
+PREVIEW_SIZE = (5, 1.25)  # Inches; fits the launcher window at PREVIEW_DPI
+PREVIEW_DPI = 75
 
 # Create the Tkinter GUI
 root = tk.Tk()
@@ -75,5 +101,17 @@ percentage_entry.pack(pady=5)
 # Submit button
 tk.Button(root, text="Create Visualization", command=create_visualization).pack(pady=20)
 
+# Optional live preview rendered in a worker thread, e.g. python sliderV2-2.py --preview
+if "--preview" in sys.argv:
+    import seaborn as sns
+    # Style is global matplotlib state; set it here, not from the render thread
+    sns.set_style("whitegrid")
+    root.geometry("400x480")
+    preview_pool = RenderPool(root, workers=1)  # matplotlib is not thread-safe, one worker
+    preview_label = tk.Label(root)
+    preview_label.pack(pady=5)
+    label_text.bind("<KeyRelease>", update_preview)
+    percentage_entry.bind("<KeyRelease>", update_preview)
+
 # Start the Tkinter main loop
 root.mainloop()
\ No newline at end of file
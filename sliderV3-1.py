@@ -1,7 +1,5 @@
-import seaborn as sns
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import numpy as np
+import sys
+from gauges.colors import get_color
 
 def get_valid_label():
     """Prompt user for a label (up to three lines) and validate input."""
@@ -26,20 +24,13 @@ def get_valid_percentage():
         except ValueError:
             print("Please enter a valid number.")
 
-def get_color(percentage):
-    """Calculate color based on percentage (red at 0%, orange at 50%, green at 100%)."""
-    if percentage < 50:
-        # Transition from red (0%) to orange (50%)
-        norm = percentage / 50
-        color = mcolors.to_hex((1, norm, 0))  # Red to orange
-    else:
-        # Transition from orange (50%) to green (100%)
-        norm = (percentage - 50) / 50
-        color = mcolors.to_hex((1 - norm, 1, 0))  # Orange to green
-    return color
-
 def visualize_percentage(label, percentage):
     """Create a visualization of the percentage with a color-coded bar."""
+    # Plotting libraries are imported on first use to keep startup fast
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     # Set seaborn style
     sns.set_style("whitegrid")
     
@@ -73,6 +64,17 @@ def visualize_percentage(label, percentage):
 
 def main():
     """Main function to run the percentage visualizer."""
+    # Live mode: python sliderV3-1.py --live [--feed tcp:9000] [--hz 60]
+    if "--live" in sys.argv:
+        from gauges.mpl_live import main as live_main
+        live_main(["--style", "bar"] + [arg for arg in sys.argv[1:] if arg != "--live"])
+        return
+    # Batch mode: python sliderV3-1.py --input metrics.csv OUT_DIR [--rejects rejects.csv]
+    if "--input" in sys.argv:
+        from gauges.batch_render import main as batch_main
+        args = [arg for arg in sys.argv[1:] if arg != "--input"]
+        batch_main(args + ["--style", "bar"])
+        return
     label = get_valid_label()
     percentage = get_valid_percentage()
     visualize_percentage(label, percentage)
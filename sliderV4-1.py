@@ -2,6 +2,13 @@ import asyncio
 import platform
 import pygame
 import math
+import sys
+import time
+from gauges.colors import get_color_rgb as interpolate_color
+from gauges.frametime import NULL_TIMER, FrameTimer, trace_path_from_argv
+from gauges.aio_feed import sources_from_argv, start_ingest
+from gauges.pacing import FrameScheduler, fps_from_argv
+from gauges.text_cache import TextCache
 
 # Initialize Pygame
 pygame.init()
@@ -18,6 +25,7 @@ GRAY = (200, 200, 200)
 
 # Font
 font = pygame.font.SysFont("arial", 24)
+text_cache = TextCache(maxsize=128)  # Rendered text surfaces, see text_cache.stats()
 
 # Input variables
 label_lines = ["", "", ""]
@@ -26,80 +34,254 @@ percentage = ""
 input_active = True
 input_type = "label"  # Switch between "label" and "percentage"
 
-def interpolate_color(percentage):
-    """Interpolate color from red (0%) to orange (50%) to green (100%)."""
-    if percentage <= 50:
-        # Red (255, 0, 0) to Orange (255, 165, 0)
-        r = 255
-        g = int(165 * (percentage / 50))
-        b = 0
-    else:
-        # Orange (255, 165, 0) to Green (0, 255, 0)
-        r = int(255 * (1 - (percentage - 50) / 50))
-        g = 255
-        b = 0
-    return (r, g, b)
-
-def draw_donut_dial(screen, percentage, color):
-    """Draw a donut dial representing the percentage."""
-    center = (WIDTH // 2, HEIGHT // 2 - 50)
-    outer_radius = 100
-    inner_radius = 60
-    # Draw background circle
-    pygame.draw.circle(screen, GRAY, center, outer_radius)
-    pygame.draw.circle(screen, WHITE, center, inner_radius)
-    # Draw percentage arc
-    start_angle = -math.pi / 2  # Start at top
-    end_angle = start_angle + (2 * math.pi * (percentage / 100))
-    num_points = 100
-    for i in range(num_points):
-        angle = start_angle + (end_angle - start_angle) * (i / num_points)
-        next_angle = start_angle + (end_angle - start_angle) * ((i + 1) / num_points)
-        outer_points = [
-            (center[0] + outer_radius * math.cos(angle), center[1] + outer_radius * math.sin(angle)),
-            (center[0] + outer_radius * math.cos(next_angle), center[1] + outer_radius * math.sin(next_angle)),
-        ]
-        inner_points = [
-            (center[0] + inner_radius * math.cos(next_angle), center[1] + inner_radius * math.sin(next_angle)),
-            (center[0] + inner_radius * math.cos(angle), center[1] + inner_radius * math.sin(angle)),
-        ]
-        pygame.draw.polygon(screen, color, outer_points + inner_points)
-
-def draw_text():
-    """Draw the label and percentage text."""
+# Render scheduling
+TARGET_FPS = 60               # Frame rate while something is changing, see --fps and --adaptive
+IDLE_POLL_INTERVAL = 0.1      # Input poll interval once the screen is static
+HOT_PERIOD = 1.0              # Seconds to stay at full rate after the last keypress
+dirty = True                  # Set whenever state changes and a frame must be drawn
+wake_event = None             # asyncio.Event that wakes the loop early, see request_redraw
+scheduler = None              # FrameScheduler, created in update_loop
+ingest = None                 # gauges.aio_feed.LatestBuffer when started with --listen
+
+# Frame timing, enabled by --overlay or --trace FILE
+frame_timer = NULL_TIMER
+show_overlay = False
+trace_path = None
+OVERLAY_INTERVAL = 0.25       # Seconds between overlay refreshes
+overlay_font = None
+overlay_rect = None
+next_overlay = 0.0
+
+# Dial geometry
+DIAL_CENTER = (WIDTH // 2, HEIGHT // 2 - 50)
+OUTER_RADIUS = 100
+INNER_RADIUS = 60
+DIAL_RECT = pygame.Rect(0, 0, 2 * OUTER_RADIUS, 2 * OUTER_RADIUS)
+DIAL_RECT.center = DIAL_CENTER
+DIRTY_RECT = DIAL_RECT.inflate(2, 2)  # Polygon edges can reach one pixel past DIAL_RECT
+ARC_SEGMENTS = 100
+
+# Unit vectors for every segment boundary, starting at the top and going clockwise
+ARC_UNIT = [(math.cos(-math.pi / 2 + 2 * math.pi * i / ARC_SEGMENTS),
+             math.sin(-math.pi / 2 + 2 * math.pi * i / ARC_SEGMENTS)) for i in range(ARC_SEGMENTS + 1)]
+
+# Cached layers, built in setup()
+ring_background = None
+dial_region = DIRTY_RECT  # Screen area owned by the dial
+dial_sprites = None      # AtlasSurfaces when started with --atlas
+dial_key = None    # (percentage, color) currently on screen, None when hidden
+text_slots = {}    # slot name -> (text, surface, rect) currently on screen
+
+# Value history, shown as a sparkline under the dial
+SPARK_RECT = pygame.Rect(WIDTH // 2 - 100, DIAL_CENTER[1] + OUTER_RADIUS + 4, 200, 20)
+SPARK_COLOR = (85, 85, 85)
+history = None         # gauges.history.History, created with the first value
+spark_version = None   # history.version currently on screen
+
+def render_ring_background():
+    """Pre-render the grey ring with its white hole to a Surface."""
+    surface = pygame.Surface(DIAL_RECT.size)
+    surface.fill(WHITE)
+    center = (OUTER_RADIUS, OUTER_RADIUS)
+    pygame.draw.circle(surface, GRAY, center, OUTER_RADIUS)
+    pygame.draw.circle(surface, WHITE, center, INNER_RADIUS)
+    return surface
+
+def draw_donut_dial(screen, percentage, color, label=None):
+    """Draw a donut dial representing the percentage, with an optional center label."""
+    screen.blit(ring_background, DIAL_RECT)
+    if percentage > 0:
+        draw_arc(screen, percentage, color)
+    if label:
+        label_surface = text_cache.render(font, label, BLACK)
+        screen.blit(label_surface, label_surface.get_rect(center=DIAL_CENTER))
+
+def draw_arc(screen, percentage, color):
+    """Draw the filled part of the donut as a single polygon."""
+    # Whole segments come from the unit table, the last point is exact
+    steps = int(ARC_SEGMENTS * percentage / 100)
+    end_angle = -math.pi / 2 + 2 * math.pi * (percentage / 100)
+    unit = ARC_UNIT[:steps + 1] + [(math.cos(end_angle), math.sin(end_angle))]
+    cx, cy = DIAL_CENTER
+    outer_points = [(cx + OUTER_RADIUS * ux, cy + OUTER_RADIUS * uy) for ux, uy in unit]
+    inner_points = [(cx + INNER_RADIUS * ux, cy + INNER_RADIUS * uy) for ux, uy in reversed(unit)]
+    pygame.draw.polygon(screen, color, outer_points + inner_points)
+
+def update_text_slot(name, text, center, dirty):
+    """Re-render a text slot only when its text changed, recording dirty rects."""
+    old = text_slots.get(name)
+    if old is not None and old[0] == text:
+        return
+    if old is not None:
+        screen.fill(WHITE, old[2])  # Clear the previous text
+        dirty.append(old[2])
+    surface = text_cache.render(font, text, BLACK)
+    rect = surface.get_rect(center=center)
+    screen.fill(WHITE, rect)  # Clear background for text
+    screen.blit(surface, rect)
+    text_slots[name] = (text, surface, rect)
+    dirty.append(rect)
+
+def draw_text(dirty):
+    """Draw the label and percentage text, updating only changed lines."""
     # Draw label (up to 3 lines)
     for i, line in enumerate(label_lines):
-        text_surface = font.render(line, True, BLACK)
-        text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT - 100 + i * 30))
-        screen.fill(WHITE, text_rect)  # Clear background for text
-        screen.blit(text_surface, text_rect)
+        update_text_slot(("label", i), line, (WIDTH // 2, HEIGHT - 100 + i * 30), dirty)
     # Draw percentage
     perc_text = f"{percentage}%" if percentage and percentage.replace(".", "").isdigit() else ""
-    perc_surface = font.render(perc_text, True, BLACK)
-    perc_rect = perc_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
-    screen.fill(WHITE, perc_rect)  # Clear background for text
-    screen.blit(perc_surface, perc_rect)
+    update_text_slot("percentage", perc_text, DIAL_CENTER, dirty)
     # Draw input prompt
+    prompt = ""
     if input_active:
         prompt = "Enter label line {}: ".format(current_line + 1) if input_type == "label" else "Enter percentage: "
-        prompt_surface = font.render(prompt, True, BLACK)
-        prompt_rect = prompt_surface.get_rect(center=(WIDTH // 2, HEIGHT - 160))
-        screen.fill(WHITE, prompt_rect)  # Clear background for prompt
-        screen.blit(prompt_surface, prompt_rect)
+    update_text_slot("prompt", prompt, (WIDTH // 2, HEIGHT - 160), dirty)
+
+def draw_dial(dirty):
+    """Redraw the dial region if the shown value changed. Returns True if redrawn."""
+    global dial_key
+    key = None
+    if not input_active and percentage.replace(".", "").isdigit():
+        perc = float(percentage)
+        key = (perc, interpolate_color(perc))
+    if key == dial_key:
+        return False
+    screen.fill(WHITE, dial_region)
+    if key is not None and dial_sprites is not None:
+        # Pre-rendered frame from the shared atlas, no drawing at all
+        sprite = dial_sprites.surface(key[0])
+        screen.blit(sprite, sprite.get_rect(center=DIAL_CENTER))
+    elif key is not None:
+        draw_donut_dial(screen, *key)
+    dial_key = key
+    dirty.append(dial_region)
+    return True
+
+def record_value(perc):
+    """Append a value to the history and schedule a redraw."""
+    global history
+    if history is None:
+        from gauges.history import History
+        history = History()
+    history.append(perc)
+    request_redraw()
+
+def draw_sparkline(dirty):
+    """Redraw the history sparkline if new samples arrived."""
+    global spark_version
+    if history is None or history.version == spark_version:
+        return
+    from gauges.history import sparkline_points
+    spark_version = history.version
+    screen.fill(WHITE, SPARK_RECT)
+    points = sparkline_points(history, *SPARK_RECT)
+    if points:
+        pygame.draw.aalines(screen, SPARK_COLOR, False, points)
+    dirty.append(SPARK_RECT)
+
+def render_frame():
+    """Redraw only what changed and push the changed regions to the display."""
+    dirty = []
+    # The percentage text sits on top of the dial, so repaint it with the dial
+    if draw_dial(dirty):
+        text_slots.pop("percentage", None)
+    frame_timer.mark("draw_dial")
+    draw_text(dirty)
+    frame_timer.mark("draw_text")
+    draw_sparkline(dirty)
+    frame_timer.mark("draw_history")
+    if dirty:
+        pygame.display.update(dirty)
+    frame_timer.mark("flip")
+
+def draw_overlay():
+    """Refresh the FPS and frame time overlay in the top-left corner."""
+    global overlay_rect, next_overlay
+    now = time.monotonic()
+    if now < next_overlay:
+        return
+    next_overlay = now + OVERLAY_INTERVAL
+    dirty = []
+    if overlay_rect is not None:
+        screen.fill(WHITE, overlay_rect)
+        dirty.append(overlay_rect)
+    y = 4
+    rects = []
+    for line in frame_timer.summary_lines() + [scheduler.summary()]:
+        # The numbers change on every refresh, so these are not worth caching
+        rects.append(screen.blit(overlay_font.render(line, True, BLACK), (4, y)))
+        y = rects[-1].bottom
+    overlay_rect = rects[0].unionall(rects[1:])
+    dirty.append(overlay_rect)
+    pygame.display.update(dirty)
 
 def setup():
     """Initialize the game state."""
+    global ring_background, dial_sprites, dial_region, frame_timer, show_overlay, trace_path, overlay_font
+    ring_background = render_ring_background()
+    show_overlay = "--overlay" in sys.argv
+    trace_path = trace_path_from_argv()
+    if show_overlay or trace_path:
+        frame_timer = FrameTimer()
+        overlay_font = pygame.font.SysFont("arial", 14)
+    if "--atlas" in sys.argv:
+        from gauges.atlas import AtlasSurfaces, open_atlas, size_for_radius
+        dial_sprites = AtlasSurfaces(open_atlas("donut", size_for_radius("donut", OUTER_RADIUS)))
+        frame_rect = dial_sprites.surface(0).get_rect(center=DIAL_CENTER)
+        dial_region = DIRTY_RECT.union(frame_rect)
     screen.fill(WHITE)
+    pygame.display.flip()
+
+def apply_ingest():
+    """Show the newest value received on the sockets; older pending values are dropped.
+
+    Returns True if a value was applied.
+    """
+    global input_active, percentage, label_lines
+    values = ingest.drain()
+    if not values:
+        return False
+    label, perc = next(reversed(values.items()))
+    lines = label.split("\n")[:3]
+    label_lines = lines + [""] * (3 - len(lines))
+    # Fixed point, since draw_dial and draw_text only accept digits and a dot
+    percentage = f"{perc:.4f}".rstrip("0").rstrip(".")
+    input_active = False
+    record_value(perc)
+    return True
+
+def request_redraw():
+    """Mark the screen dirty and wake the loop if it is idle.
+
+    Data sources running on the event loop call this after changing state.
+    """
+    global dirty
+    dirty = True
+    if wake_event is not None:
+        wake_event.set()
 
 async def update_loop():
     """Main update loop for handling input and drawing."""
-    global input_active, input_type, current_line, percentage, label_lines
+    global input_active, input_type, current_line, percentage, label_lines, dirty, wake_event, scheduler, ingest
+    wake_event = asyncio.Event()
+    scheduler = FrameScheduler(fps_from_argv(default=TARGET_FPS), adaptive="--adaptive" in sys.argv)
+    setup()
+    listeners = []
+    sources = sources_from_argv()
+    if sources:
+        # Feed the dial from local sockets, e.g. --listen udp:9000
+        ingest, listeners = await start_ingest(sources, on_update=request_redraw)
+    last_input = 0.0
     running = True
     while running:
+        frame_timer.begin()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                pygame.display.flip()  # Window was uncovered, repaint everything
             elif input_active and event.type == pygame.KEYDOWN:
+                dirty = True
+                last_input = time.monotonic()
                 if event.key == pygame.K_BACKSPACE:
                     if input_type == "label" and label_lines[current_line]:
                         label_lines[current_line] = label_lines[current_line][:-1]
@@ -116,6 +298,7 @@ async def update_loop():
                             perc = float(percentage)
                             if 0 <= perc <= 100:
                                 input_active = False
+                                record_value(perc)
                         except ValueError:
                             percentage = ""  # Reset invalid input
                 elif event.unicode.isprintable():
@@ -125,22 +308,37 @@ async def update_loop():
                         if event.unicode.isdigit() or event.unicode == ".":
                             percentage += event.unicode
 
-        # Clear screen
-        screen.fill(WHITE)
-
-        # Draw visualization if percentage is entered
-        if not input_active and percentage.replace(".", "").isdigit():
-            perc = float(percentage)
-            color = interpolate_color(perc)
-            draw_donut_dial(screen, perc, color)
+        if ingest is not None and apply_ingest():
+            last_input = time.monotonic()  # Stay on the paced frame rate while data flows
+        frame_timer.mark("events")
 
-        # Draw text
-        draw_text()
+        # Redraw changed regions only, and only when something changed.
+        # After an overrun the scheduler skips drawing; dirty stays set for the next frame
+        rendered = dirty and scheduler.should_render()
+        if rendered:
+            dirty = False
+            render_frame()
+        if show_overlay:
+            draw_overlay()
+            frame_timer.mark("overlay")
 
-        # Update display
-        pygame.display.flip()
+        if dirty or time.monotonic() - last_input < HOT_PERIOD:
+            await scheduler.wait()
+        else:
+            # Idle: sleep until a data source wakes us or it is time to poll input
+            wake_event.clear()
+            try:
+                await asyncio.wait_for(wake_event.wait(), IDLE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            scheduler.reset()
+        frame_timer.mark("sleep")
+        frame_timer.end(rendered)
 
-        await asyncio.sleep(1.0 / 60)  # 60 FPS
+    for listener in listeners:
+        listener.close()
+    if trace_path:
+        frame_timer.write_trace(trace_path)
 
 if platform.system() == "Emscripten":
     asyncio.ensure_future(update_loop())